@@ -0,0 +1,111 @@
+import ast
+import re
+import textwrap
+import types
+import prs
+
+# Compilador Syra -> código Python.
+# Converte o corpo de funções, lambdas e métodos Syra em uma única função
+# Python via compile(), feito uma vez só. As chamadas passam a executar o
+# code object pronto em vez de reanalisar e avaliar cada linha do corpo.
+
+SUPER_RE = re.compile(r"super\((.*)\)")
+MISSING = object()  # Padrão de parâmetro não informado na chamada (ligado como __syra_missing__)
+
+def is_syra_lambda(expr):
+    """Indica se a expressão é uma definição de lambda Syra: `(params) is expr`."""
+    return expr.startswith("(") and ") is " in expr
+
+def lower_return(expr):
+    """Traduz `return expr`; lambdas Syra viram chamadas a __syra_lambda__."""
+    expr = expr.strip()
+    if not expr:
+        return "return None"
+    if is_syra_lambda(expr):
+        return f"return __syra_lambda__({expr!r}, locals(), globals())"
+    return f"return {expr}"
+
+def _code_lines(body_lines):
+    """Remove comentários e linhas vazias, preservando a indentação relativa."""
+    lines = [prs.strip_comment(l).rstrip() for l in body_lines]
+    lines = [l for l in lines if l.strip()]
+    return textwrap.dedent("\n".join(lines)).splitlines()
+
+def _split_indent(line):
+    stripped = line.lstrip()
+    return line[:len(line) - len(stripped)], stripped
+
+def _build(fn_name, params, body, filename):
+    """Compila `def fn_name(params): body` e devolve o code object da função."""
+    source = f"def {fn_name}({', '.join(params)}):\n" + "\n".join("    " + l for l in (body or ["pass"]))
+    module_code = compile(source, filename, "exec")
+    for const in module_code.co_consts:
+        if isinstance(const, types.CodeType) and const.co_name == fn_name:
+            return const
+    raise SyntaxError(f"Falha ao compilar '{filename}'")
+
+def compile_function(name, param_names, body_lines, is_expr_body):
+    """
+    Compila o corpo de uma SyraFunction.
+    Os parâmetros viram parâmetros posicionais da função Python gerada;
+    a ligação de argumentos continua a cargo de SyraFunction.
+    """
+    if is_expr_body:
+        body = [lower_return(body_lines[0])]
+    else:
+        body = []
+        for line in _code_lines(body_lines):
+            indent, stripped = _split_indent(line)
+            if stripped == "return" or stripped.startswith("return "):
+                body.append(indent + lower_return(stripped[len("return"):]))
+            else:
+                body.append(line)
+    return _build("__syra_fn__", param_names, body, f"<syra:{name}>")
+
+def compile_method(method_code, has_base):
+    """
+    Compila um método de classe Syra (instância ou static).
+    Retorna (code, param_names, defaults). Métodos de instância recebem
+    (__super__, self, ...). Parâmetros sem padrão no cabeçalho valem None;
+    os com padrão (ex: passo=10) recebem MISSING em defaults e a expressão
+    é avaliada a cada chamada em que o argumento falta.
+    Chamado uma vez por método, em obj.define_class.
+    """
+    lines = method_code.splitlines()
+    header = lines[0].strip()
+    is_static = header.startswith("static ")
+    params = re.search(r"\((.*)\)\s*:", header)
+    param_names, default_exprs = _method_params(params.group(1) if params else "")
+    body = [f"if {p} is __syra_missing__: {p} = {expr}" for p, expr in zip(param_names, default_exprs) if expr]
+    for line in _code_lines(lines[1:]):
+        indent, stripped = _split_indent(line)
+        m = SUPER_RE.match(stripped)
+        if m:
+            # super(...) só tem efeito em classes com base
+            body.append(indent + (f"__super__({m.group(1)})" if has_base else "pass"))
+        elif stripped.startswith("shw("):
+            body.append(indent + "print(" + stripped[4:])
+        elif stripped == "return" or stripped.startswith("return "):
+            body.append(indent + "return " + (stripped[len("return"):].strip() or "None"))
+        else:
+            body.append(line)
+    signature = [f"{p}=None" for p in param_names]
+    if not is_static:
+        signature = ["__super__", "self"] + signature
+    name = header.split("(", 1)[0].replace("static ", "").strip()
+    defaults = tuple(MISSING if expr else None for expr in default_exprs)
+    return _build("__syra_method__", signature, body, f"<syra:{name}>"), param_names, defaults
+
+def _method_params(params):
+    """Nomes e textos dos padrões dos parâmetros: 'v, passo=10' -> ['v', 'passo'], [None, '10']."""
+    if not params.strip():
+        return [], []
+    source = f"def _({params}): pass"
+    args = ast.parse(source).body[0].args
+    first_default = len(args.args) - len(args.defaults)
+    default_exprs = [None] * first_default + [ast.get_source_segment(source, d) for d in args.defaults]
+    return [a.arg for a in args.args], default_exprs
+
+def make_function(code, env, defaults=()):
+    """Cria a função Python a partir do code object, usando env como globals e os valores padrão dados."""
+    return types.FunctionType(code, env, None, tuple(defaults) or None)
@@ -1,7 +1,68 @@
+import ast
 import re
+import time
+import types
 import uuid
+from collections import OrderedDict
+import cmpl
 
-syra_functions = {}  # Armazenamento global para funções Syra definidas
+class SyraNamespace(dict):
+    """
+    Frame de escopo encadeado: procura nas próprias chaves, depois em `scope`
+    (um mapeamento lido por referência, sem cópia) e por fim no frame pai.
+    """
+    def __init__(self, values=None, parent=None, scope=None):
+        super().__init__(values or {})
+        self.parent = parent
+        self.scope = scope
+
+    def __missing__(self, key):
+        scope = self.scope
+        if scope is not None and key in scope:
+            return scope[key]
+        if self.parent is None:
+            raise KeyError(key)
+        return self.parent[key]
+
+def closure_frame(defining_env):
+    """Frame de closure sobre defining_env, capturado por referência (O(1))."""
+    if defining_env is None or isinstance(defining_env, SyraNamespace):
+        return defining_env
+    return SyraNamespace(parent=syra_namespace, scope=defining_env)
+
+# Nomes sempre disponíveis para o código das funções Syra (preenchido após _syra_lambda)
+SYRA_BUILTINS = {}
+
+# Namespace global compartilhado por todas as funções Syra: builtins + funções
+# definidas. É atualizado no lugar quando funções são (re)definidas, então
+# chamar uma função não depende de quantas existem no programa.
+syra_namespace = {}
+namespace_version = 0  # Incrementada a cada (re)definição de função
+name_versions = {}  # {nome: namespace_version da última (re)definição desse nome}
+
+class FunctionTable(dict):
+    """Tabela de funções Syra que mantém syra_namespace sincronizado."""
+    def __setitem__(self, name, func_obj):
+        global namespace_version
+        super().__setitem__(name, func_obj)
+        if name not in SYRA_BUILTINS: # Builtins têm precedência, como no antigo syra_env
+            syra_namespace[name] = func_obj
+        namespace_version += 1
+        name_versions[name] = namespace_version
+
+    def __delitem__(self, name):
+        global namespace_version
+        super().__delitem__(name)
+        if name not in SYRA_BUILTINS:
+            syra_namespace.pop(name, None)
+        namespace_version += 1
+        name_versions[name] = namespace_version
+
+    def clear(self):
+        for name in list(self):
+            del self[name]
+
+syra_functions = FunctionTable()  # Armazenamento global para funções Syra definidas
 
 class SyraExecutionError(Exception):
     """Exceção customizada para erros durante a execução de funções Syra."""
@@ -111,55 +172,36 @@ def parse_syra_function_header(header_line):
     return func_name, parsed_params, expr_body_candidate.strip(), return_type_hint.strip() if return_type_hint else None
 
 def syra_env(base_vars=None):
-    """Cria um ambiente de execução seguro e controlado para código Syra."""
-    env = {
-        "str": str, "int": int, "float": float, "len": len, "print": print,
-        "True": True, "False": False, "None": None,
-    }
-    if base_vars:
-        env.update(base_vars)
-    
-    for fname, func_obj in syra_functions.items():
-        if fname not in env:
-            env[fname] = func_obj
-            
-    return env
+    """Cria um ambiente de execução: base_vars em uma camada sobre o namespace compartilhado."""
+    return SyraNamespace(base_vars, parent=syra_namespace)
 
-# Helper function for Syra-aware evaluation, especially for 'retornar'
-def _syra_eval_for_return(expr_str, environment):
-    expr_str = expr_str.strip()
-    
-    # Check if the expression string itself IS a Syra lambda definition string
-    if expr_str.startswith("(") and ") is " in expr_str:
-        try:
-            # Attempt to define it as a Syra lambda.
-            # define_syra_lambda should return a SyraFunction or raise an error.
-            syra_lambda_func = define_syra_lambda(expr_str, defining_env=environment)
-            # It's crucial that define_syra_lambda itself is robust and returns SyraFunction
-            # or raises a specific error if it can't.
-            return syra_lambda_func 
-        except SyntaxError as e_lambda_syn:
-            # This will catch syntax errors from define_syra_lambda's parsing
-            raise SyraExecutionError(f"Erro de sintaxe na definição da lambda de retorno '{expr_str}': {e_lambda_syn}")
-        except Exception as e_lambda_other: 
-            # This will catch other errors from define_syra_lambda
-            raise SyraExecutionError(f"Erro inesperado ao definir lambda de retorno '{expr_str}': {e_lambda_other}")
-    else: # Not a Syra lambda string, try Python eval for other expressions
-        try:
-            # This eval is for Python expressions or Syra variables that resolve to Python types
-            return eval(expr_str, environment)
-        except NameError as e_name:
-            # Check if it's a variable name present in the environment
-            if expr_str in environment: # This handles cases where expr_str is just a variable name
-                return environment[expr_str]
-            # Otherwise, it's a genuine NameError within the Python eval context
-            raise SyraExecutionError(f"Nome não definido ao avaliar expressão de retorno Python '{expr_str}': {e_name}")
-        except SyntaxError as e_syn_py:
-            # Python eval found a syntax error (e.g., if a non-lambda Syra construct was passed)
-            raise SyraExecutionError(f"Erro de sintaxe Python ao avaliar expressão de retorno '{expr_str}': {e_syn_py}")
-        except Exception as e_eval_other:
-            # Other errors during Python eval
-            raise SyraExecutionError(f"Erro Python ao avaliar expressão de retorno '{expr_str}': {e_eval_other}")
+def _syra_lambda(expr_str, local_vars, parent_env):
+    """
+    Cria a lambda Syra retornada por um corpo compilado (`return (x) is ...`).
+    A closure é um frame com os locais da função definidora encadeado ao
+    escopo dela (parent_env), sem copiar os escopos de fora.
+    """
+    try:
+        return define_syra_lambda(expr_str, defining_env=SyraNamespace(local_vars, parent=parent_env))
+    except SyntaxError as e_lambda_syn:
+        raise SyraExecutionError(f"Erro de sintaxe na definição da lambda de retorno '{expr_str}': {e_lambda_syn}")
+    except Exception as e_lambda_other:
+        raise SyraExecutionError(f"Erro inesperado ao definir lambda de retorno '{expr_str}': {e_lambda_other}")
+
+SYRA_BUILTINS.update({
+    "str": str, "int": int, "float": float, "len": len, "print": print,
+    "True": True, "False": False, "None": None,
+    "__syra_lambda__": _syra_lambda,
+})
+syra_namespace.update(SYRA_BUILTINS)
+
+_SCALAR_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+def _is_immutable(value):
+    """Indica se um padrão literal pode ser compartilhado entre chamadas (tuplas só com imutáveis)."""
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, _SCALAR_TYPES)
 
 class SyraFunction:
     def __init__(self, name, params_info_list, body_lines, is_expr_body, docstring=None, return_type_hint=None, closure_env=None):
@@ -169,96 +211,133 @@ class SyraFunction:
         self.is_expr_body = is_expr_body
         self.docstring = docstring
         self.return_type_hint = return_type_hint
-        self.closure_env = closure_env
+        self.closure_env = closure_frame(closure_env) # Frame encadeado, não uma cópia
 
         self.param_names = [p['name'] for p in self.params_info if p['name']] # Exclui o '*' anônimo
         self.vararg_param_name = next((p['name'] for p in self.params_info if p['is_vararg']), None)
-
-    def __call__(self, *args, **kwargs):
-        local_vars = {}
-        args_iter = iter(args)
-        
-        # 1. Mapear argumentos posicionais
+        self._code = None # Corpo compilado (cmpl.compile_function), gerado na primeira chamada
+        self._body_fn = None # Função Python do corpo, ligada ao namespace (criada uma vez)
+        self._build_binding_plan()
+
+    def _build_binding_plan(self):
+        """
+        Pré-calcula, na definição, como ligar argumentos aos parâmetros:
+        nomes posicionais, obrigatórios e valores padrão. Padrões literais
+        imutáveis são avaliados uma vez; os demais são compilados e avaliados
+        a cada chamada, como antes.
+        """
+        self._positional = []
+        self._required = []
+        self._defaults = [] # [(nome, valor_constante, code_ou_None, texto)]
         for p_info in self.params_info:
             if p_info['is_vararg']:
-                local_vars[p_info['name']] = tuple(args_iter)
-                break 
-            if p_info['is_keyword_only']: 
-                break
+                continue
+            name = p_info['name']
+            if not p_info['is_keyword_only']:
+                self._positional.append(name)
+            default_str = p_info['default_value_str']
+            if default_str is None:
+                if not p_info['is_keyword_only']:
+                    self._required.append(name)
+                continue
             try:
-                val = next(args_iter)
-                if p_info['name'] in kwargs:
-                    raise SyraExecutionError(
-                        f"Função '{self.name}' recebeu múltiplos valores para o argumento '{p_info['name']}'"
-                    )
-                local_vars[p_info['name']] = val
-            except StopIteration:
-                pass 
-        
-        remaining_pos_args = list(args_iter)
-        if remaining_pos_args:
-            if not self.vararg_param_name:
-                 raise SyraExecutionError(
-                    f"Função '{self.name}' esperava menos argumentos posicionais, mas recebeu {len(args)}"
+                value = ast.literal_eval(default_str)
+                if _is_immutable(value):
+                    self._defaults.append((name, value, None, default_str))
+                    continue
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                pass
+            try:
+                code = compile(default_str, f"<syra:{self.name}:{name}>", "eval")
+            except SyntaxError:
+                code = default_str # O erro aparece na chamada, como antes
+            self._defaults.append((name, None, code, default_str))
+        self._param_set = frozenset(self.param_names)
+        # Caminho rápido: só parâmetros posicionais, chamada sem keywords
+        self._fast_arity = len(self._positional) if len(self._positional) == len(self.param_names) else -1
+
+    def compiled_code(self):
+        """Retorna o code object do corpo, compilando-o uma única vez."""
+        if self._code is None:
+            self._code = cmpl.compile_function(self.name, self.param_names, self.body_lines, self.is_expr_body)
+        return self._code
+
+    def _make_body_fn(self):
+        """
+        Cria a função do corpo uma única vez. Sem closure, usa o namespace
+        compartilhado diretamente; com closure, o próprio frame da closure
+        (que termina no namespace compartilhado).
+        """
+        env = self.closure_env if self.closure_env is not None else syra_namespace
+        self._body_fn = cmpl.make_function(self.compiled_code(), env)
+        return self._body_fn
+
+    def _bind_arguments(self, args, kwargs, exec_env):
+        """Liga args/kwargs aos parâmetros seguindo o plano; retorna os valores na ordem de param_names."""
+        local_vars = {}
+        positional = self._positional
+
+        # 1. Mapear argumentos posicionais
+        if len(args) > len(positional) and not self.vararg_param_name:
+            raise SyraExecutionError(
+                f"Função '{self.name}' esperava menos argumentos posicionais, mas recebeu {len(args)}"
+            )
+        for name, val in zip(positional, args):
+            if name in kwargs:
+                raise SyraExecutionError(
+                    f"Função '{self.name}' recebeu múltiplos valores para o argumento '{name}'"
                 )
+            local_vars[name] = val
+        if self.vararg_param_name:
+            local_vars[self.vararg_param_name] = tuple(args[len(positional):])
 
         # 2. Mapear argumentos nomeados (keywords)
         for kw_name, kw_val in kwargs.items():
-            if kw_name not in self.param_names:
+            if kw_name not in self._param_set:
                 raise SyraExecutionError(
                     f"Função '{self.name}' recebeu um argumento nomeado inesperado '{kw_name}'"
                 )
-            if kw_name in local_vars and local_vars[kw_name] is not kwargs[kw_name]: 
-                 raise SyraExecutionError(
+            if kw_name in local_vars:
+                raise SyraExecutionError(
                     f"Função '{self.name}' recebeu múltiplos valores para o argumento '{kw_name}'"
                 )
             local_vars[kw_name] = kw_val
 
         # 3. Aplicar valores padrão e verificar argumentos obrigatórios ausentes
-        env_for_defaults = syra_env(self.closure_env if hasattr(self, 'closure_env') else None) 
-
-        for p_info in self.params_info:
-            if p_info['is_vararg']:
-                if p_info['name'] not in local_vars:
-                     local_vars[p_info['name']] = tuple()
+        for name, value, code, default_str in self._defaults:
+            if name in local_vars:
                 continue
+            if code is None:
+                local_vars[name] = value
+                continue
+            try:
+                local_vars[name] = eval(code, exec_env)
+            except Exception as e_def:
+                raise SyraExecutionError(
+                    f"Erro ao avaliar valor padrão para '{name}' na função '{self.name}': {e_def}"
+                )
+        for name in self._required:
+            if name not in local_vars:
+                raise SyraExecutionError(
+                    f"Função '{self.name}' não recebeu o argumento obrigatório: '{name}'"
+                )
+        return [local_vars.get(name) for name in self.param_names]
 
-            if p_info['name'] not in local_vars:
-                if p_info['default_value_str'] is not None:
-                    try:
-                        default_val = eval(p_info['default_value_str'], env_for_defaults)
-                        local_vars[p_info['name']] = default_val
-                    except Exception as e_def:
-                        raise SyraExecutionError(
-                            f"Erro ao avaliar valor padrão para '{p_info['name']}' na função '{self.name}': {e_def}"
-                        )
-                elif not p_info['is_keyword_only'] or (p_info['is_keyword_only'] and p_info['name'] in kwargs):
-                     raise SyraExecutionError(
-                        f"Função '{self.name}' não recebeu o argumento obrigatório: '{p_info['name']}'"
-                    )
-        
-        # Build execution environment, incorporating closure if it exists
-        current_closure = self.closure_env if hasattr(self, 'closure_env') and self.closure_env else {}
-        effective_env_vars = {**current_closure, **local_vars}
-        exec_env = syra_env(effective_env_vars)
+    def __call__(self, *args, **kwargs):
+        try:
+            body_fn = self._body_fn or self._make_body_fn()
+        except Exception as e_comp:
+            raise SyraExecutionError(f"Erro durante a execução da função Syra '{self.name}': {type(e_comp).__name__}: {e_comp}")
+
+        if not kwargs and len(args) == self._fast_arity:
+            bound = args
+        else:
+            bound = self._bind_arguments(args, kwargs, body_fn.__globals__)
 
         try:
-            if self.is_expr_body:
-                return _syra_eval_for_return(self.body_lines[0], exec_env)
-            else: 
-                result = None 
-                for line_content in self.body_lines:
-                    stripped_line = line_content.strip()
-                    if not stripped_line or stripped_line.startswith("//"):
-                        continue
-                    
-                    if stripped_line.startswith("return "): # Changed from "retornar "
-                        expr_to_return = stripped_line[len("return "):].strip() # Changed from "retornar "
-                        result = _syra_eval_for_return(expr_to_return, exec_env)
-                        return result 
-                    else:
-                        exec(stripped_line, exec_env) 
-                return result
+            return body_fn(*bound)
+        except SyraExecutionError:
+            raise
         except Exception as e_exec:
             error_message = f"Erro durante a execução da função Syra '{self.name}': {type(e_exec).__name__}: {e_exec}"
             raise SyraExecutionError(error_message)
@@ -280,6 +359,123 @@ class SyraFunction:
         ret_hint_repr = f" -> {self.return_type_hint}" if self.return_type_hint else ""
         return f"<SyraFunction {self.name}({', '.join(params_repr)}){ret_hint_repr}>"
 
+# ===== Decoradores nativos =====
+
+memo_functions = {}  # {nome_da_função: MemoSyraFunction} para &SyMemo
+
+def _read_names(code):
+    """Nomes globais lidos por um code object, incluindo os aninhados (lambdas, comprehensions)."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _read_names(const)
+    return names
+
+class MemoSyraFunction(SyraFunction):
+    """
+    Função Syra com cache de resultados (@memo), chaveado pelos argumentos.
+    maxsize limita as entradas (LRU; None = sem limite) e ttl, em segundos,
+    a validade de cada resultado. O cache é descartado só quando muda um
+    nome que o corpo lê, direta ou indiretamente (pelas funções Syra que
+    ele chama); definir funções sem relação com ela não afeta o cache.
+    """
+    def __init__(self, wrapped, maxsize=128, ttl=None):
+        super().__init__(wrapped.name, wrapped.params_info, wrapped.body_lines, wrapped.is_expr_body,
+                         wrapped.docstring, wrapped.return_type_hint, wrapped.closure_env)
+        if maxsize is not None and (not isinstance(maxsize, int) or maxsize < 0):
+            raise ValueError(f"maxsize inválido para @memo: {maxsize!r}")
+        if ttl is not None and (not isinstance(ttl, (int, float)) or ttl <= 0):
+            raise ValueError(f"ttl inválido para @memo: {ttl!r}")
+        self.wrapped = wrapped
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = OrderedDict() # {chave: (resultado, instante)}
+        self._cache_version = namespace_version
+        self._deps = None # Nomes de que o resultado depende (calculados na primeira chamada)
+        self._deps_versions = ()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __call__(self, *args, **kwargs):
+        try:
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            hash(key)
+        except TypeError:
+            return self.wrapped(*args, **kwargs) # Argumentos não-hasheáveis: sem cache
+        if self._deps is None or self._cache_version != namespace_version:
+            self._check_dependencies()
+        cache = self._cache
+        entry = cache.get(key)
+        if entry is not None:
+            if self.ttl is None or time.monotonic() - entry[1] < self.ttl:
+                self.stats["hits"] += 1
+                cache.move_to_end(key)
+                return entry[0]
+            del cache[key]
+            self.stats["evictions"] += 1
+        self.stats["misses"] += 1
+        result = self.wrapped(*args, **kwargs)
+        cache[key] = (result, time.monotonic())
+        if self.maxsize is not None and len(cache) > self.maxsize:
+            cache.popitem(last=False)
+            self.stats["evictions"] += 1
+        return result
+
+    def _dependencies(self):
+        """Nomes lidos pelo corpo e, transitivamente, pelas funções Syra que ele chama."""
+        seen = set()
+        pending = [self.wrapped]
+        while pending:
+            try:
+                names = _read_names(pending.pop().compiled_code())
+            except SyntaxError:
+                continue # O erro aparece na chamada da função
+            for name in names - seen:
+                seen.add(name)
+                dep = syra_functions.get(name)
+                if isinstance(dep, SyraFunction):
+                    pending.append(dep)
+        return tuple(sorted(seen))
+
+    def _check_dependencies(self):
+        """Algum namespace mudou: descarta o cache só se um nome de que ele depende mudou."""
+        if self._deps is None or tuple(name_versions.get(n) for n in self._deps) != self._deps_versions:
+            self._cache.clear()
+            self._deps = self._dependencies()
+            self._deps_versions = tuple(name_versions.get(n) for n in self._deps)
+        self._cache_version = namespace_version
+
+    def cache_info(self):
+        return {**self.stats, "size": len(self._cache), "maxsize": self.maxsize, "ttl": self.ttl}
+
+    def cache_clear(self):
+        self._cache.clear()
+
+    def __repr__(self):
+        return f"<memo {super().__repr__()}>"
+
+def _memo_decorator(func_obj, *args, **kwargs):
+    memo_func = MemoSyraFunction(func_obj, *args, **kwargs)
+    memo_functions[func_obj.name] = memo_func
+    return memo_func
+
+# Decoradores implementados em Python, usados como @nome ou @nome(args)
+native_decorators = {
+    "memo": _memo_decorator,
+}
+
+def parse_decorator(deco_text):
+    """Separa '@nome(args)' em (nome, args, kwargs); args devem ser literais."""
+    m = re.match(r"^(\w+)\s*(?:\((.*)\))?$", deco_text)
+    if not m:
+        raise SyntaxError(f"Nome de decorador inválido '{deco_text}'.")
+    name, args_str = m.groups()
+    if not args_str or not args_str.strip():
+        return name, (), {}
+    call = ast.parse(f"_({args_str})", mode="eval").body
+    args = tuple(ast.literal_eval(a) for a in call.args)
+    kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+    return name, args, kwargs
+
 def define_syra_function(code_block_str):
     # As linhas já vêm com rstrip('\n') de run_syra_file, mas splitlines() é seguro.
     all_lines_from_block = code_block_str.splitlines() 
@@ -304,7 +500,7 @@ def define_syra_function(code_block_str):
         if current_line_cleaned_for_logic.startswith('@'):
             deco_name = current_line_cleaned_for_logic[1:].strip() # Nome do decorador
             # Validação simples do nome do decorador
-            if not re.match(r"^\w+$", deco_name) or deco_name in ["is", "return"]: # Evitar palavras-chave
+            if not re.match(r"^\w+\s*(\(.*\))?$", deco_name) or deco_name in ["is", "return"]: # Evitar palavras-chave
                 print(f"[Syra Def] Erro: Nome de decorador inválido '{deco_name}'.")
                 return
             decorator_names.append(deco_name)
@@ -402,7 +598,23 @@ def define_syra_function(code_block_str):
     
     final_func_obj = func_obj
     if decorator_names:
-        for deco_name in reversed(decorator_names):
+        for deco_text in reversed(decorator_names):
+            try:
+                deco_name, deco_args, deco_kwargs = parse_decorator(deco_text)
+            except (SyntaxError, ValueError) as e_deco_syn:
+                print(f"[Syra Def] Erro: Decorador inválido '{deco_text}': {e_deco_syn}")
+                return
+            if deco_name in native_decorators:
+                try:
+                    final_func_obj = native_decorators[deco_name](final_func_obj, *deco_args, **deco_kwargs)
+                    final_func_obj.name = func_name
+                except Exception as e_deco_call:
+                    print(f"[Syra Def] Erro ao aplicar decorador '{deco_name}' à função '{func_name}': {e_deco_call}")
+                    return
+                continue
+            if deco_args or deco_kwargs:
+                print(f"[Syra Def] Erro: Decorador Syra '{deco_name}' não aceita argumentos.")
+                return
             decorator_syra_func = syra_functions.get(deco_name)
             if not decorator_syra_func or not isinstance(decorator_syra_func, SyraFunction):
                 print(f"[Syra Def] Erro: Decorador Syra '{deco_name}' não encontrado ou não é uma função Syra válida.")
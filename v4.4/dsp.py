@@ -0,0 +1,94 @@
+# Registro de comandos Syra com despacho por prefixo.
+# CommandRegistry continua sendo um dict (plugins fazem commands["x"] = f),
+# mas mantém uma trie dos nomes para achar o comando de uma linha em tempo
+# proporcional ao tamanho do nome, e não ao número de comandos registrados.
+
+_END = ""  # Chave que marca o fim de um nome na trie (nunca é um caractere)
+
+class CommandRegistry(dict):
+    """Dicionário de comandos indexado por uma trie de prefixos."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._trie = {}
+        self._order = {}  # Ordem de registro: desempata como o antigo laço sobre o dict
+        self._next_order = 0
+        self.version = 0  # Incrementada a cada alteração (invalida caches de despacho)
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name, handler):
+        if name not in self:
+            node = self._trie
+            for ch in name:
+                node = node.setdefault(ch, {})
+            node[_END] = name
+            self._order[name] = self._next_order
+            self._next_order += 1
+        super().__setitem__(name, handler)
+        self.version += 1
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        node = self._trie
+        for ch in name:
+            node = node[ch]
+        del node[_END]
+        del self._order[name]
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        for name, handler in dict(*args, **kwargs).items():
+            self[name] = handler
+
+    def setdefault(self, name, handler=None):
+        if name not in self:
+            self[name] = handler
+        return self[name]
+
+    def pop(self, name, *default):
+        if name in self:
+            handler = self[name]
+            del self[name]
+            return handler
+        if default:
+            return default[0]
+        raise KeyError(name)
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): registro de comandos vazio")
+        name = next(reversed(self))
+        return name, self.pop(name)
+
+    def clear(self):
+        super().clear()
+        self._trie = {}
+        self._order = {}
+        self.version += 1
+
+    def match(self, line):
+        """
+        Procura o comando que inicia a linha: `cmd(...)`, `cmd args` ou `cmd`.
+        Retorna (nome, args) ou None. Entre vários prefixos válidos vence o
+        registrado primeiro, como no laço `for cmd in commands` original.
+        """
+        node = self._trie
+        best = None
+        n = len(line)
+        for i, ch in enumerate(line):
+            node = node.get(ch)
+            if node is None:
+                break
+            name = node.get(_END)
+            if name is None:
+                continue
+            end = i + 1
+            if end == n:
+                args = ""
+            elif line[end] == " " or (line[end] == "(" and line.endswith(")")):
+                args = line[end:].strip()
+            else:
+                continue
+            if best is None or self._order[name] < self._order[best[0]]:
+                best = (name, args)
+        return best
@@ -1,33 +1,33 @@
+import functools
 import importlib.util
 import os
-import cv2
+from collections import OrderedDict
 import re
 import obj
 import imp  # Adicionar esta importação
+import prs
+import dsp
 import deff as syra_def
-import tps as syra_types
 import tps  # Importa o arquivo tps.py
 
 variables = {}
 syra_modules = {}  # Armazenar módulos Syra importados
-commands = {}
-# Inicializa o sistema de tipos e registra os comandos
-tps.initialize_types()
-tps.register_type_commands(commands)
-
-# No início da execução:
-syra_types.initialize_types()
-syra_types.register_type_commands(commands)
-tps.register_type_commands(commands)
+commands = dsp.CommandRegistry()  # dict de comandos com despacho por prefixo
 
 def initialize():
-    # ... código existente ...
-    syra_types.initialize_types()
-    syra_types.register_type_commands(commands)
+    """Inicializa o sistema de tipos e registra seus comandos (feito uma vez, na importação)."""
+    tps.initialize_types()
+    tps.register_type_commands(commands)
 
 initialize()
 
 def cmd_syra_vd(args):
+    # OpenCV só é carregado quando syra.vd roda (importá-lo custa centenas de ms)
+    try:
+        import cv2
+    except ImportError:
+        print("O comando syra.vd requer o OpenCV (pip install opencv-python).")
+        return
     try:
         cam_index = int(args.strip("()").strip())
     except ValueError:
@@ -130,10 +130,11 @@ def load_syra_module(module_name, names=None, aliases=None):
     if module_name in syra_modules:
         module_vars = syra_modules[module_name]
     else:
-        # Executa o módulo Syra em um escopo isolado
+        # Executa o módulo Syra em um escopo isolado; o escopo anterior é
+        # apenas guardado (referência) e restaurado no fim, sem cópias
         module_vars = {}
-        old_vars = variables.copy()
-        old_classes = obj.syra_classes.copy()
+        old_vars = variables
+        first_new_class = len(obj.class_definitions)
         
         variables = module_vars
         
@@ -141,17 +142,18 @@ def load_syra_module(module_name, names=None, aliases=None):
             run_syra_file(f"{module_name}.syra")
             
             # Copiar classes definidas para o módulo
-            for class_name, class_def in obj.syra_classes.items():
-                if class_name not in old_classes:
-                    module_vars[class_name] = class_name  # Referência à classe
-                    
-                    # Adicionar métodos estáticos como funções no namespace do módulo
-                    for method_name, method_code in class_def["methods"].items():
-                        if method_code.strip().startswith("static "):
-                            # Criar wrapper para o método estático
-                            def method_wrapper(*args, cls=class_name, m=method_name):
-                                return obj.static_call(cls, m, *args)
-                            module_vars[method_name] = method_wrapper
+            for class_name in obj.class_definitions[first_new_class:]:
+                class_def = obj.syra_classes[class_name]
+                module_vars[class_name] = class_name  # Referência à classe
+                obj.class_modules[class_name] = module_vars
+                
+                # Adicionar métodos estáticos como funções no namespace do módulo
+                for method_name, method_code in class_def["methods"].items():
+                    if method_code.strip().startswith("static "):
+                        # Criar wrapper para o método estático
+                        def method_wrapper(*args, cls=class_name, m=method_name):
+                            return obj.static_call(cls, m, *args)
+                        module_vars[method_name] = method_wrapper
                             
         finally:
             # Restaurar escopo global
@@ -183,151 +185,127 @@ def load_syra_module(module_name, names=None, aliases=None):
             else:
                 print(f"[Aviso] '{name}' não encontrado em '{module_name}'")
 
-def process_ampersand_command(line):
-    """Process commands that start with '&' like &Syope, &Sywr, etc."""
-    m = re.match(r"&(\w+)\s*\((.*)\)", line)
-    if not m:
-        return False
-    
-    cmd_name = m.group(1)
-    args_str = m.group(2)
-    
-    cmd_key = f"&{cmd_name}"
-    if cmd_key in commands:
-        result = commands[cmd_key](args_str)
-        return True
-    
-    cmd_key_lower = f"&{cmd_name.lower()}"
-    if cmd_key_lower in commands:
-        result = commands[cmd_key_lower](args_str)
-        return True
-        
+# ===== Despacho de linhas =====
+
+LINE_CACHE_SIZE = 4096  # Máximo de linhas distintas com classificação memorizada
+_line_cache = OrderedDict()  # {linha: (handler, args)}
+_line_cache_version = -1  # commands.version usada para montar o cache
+
+FUNC_DEF_RE = re.compile(r"(@\w+\s*)*\w+\s*\(.*\)\s+is(\s|:|->)")
+LAMBDA_ASSIGN_RE = re.compile(r"\$\w+\s*=\s*\(.*\)\s+is\s+.+")
+NEW_RE = re.compile(r"\$\w+\s*=\s*\w+\(.*\)")
+METHOD_CALL_RE = re.compile(r"\$\w+\.\w+\(.*\)")
+STATIC_CALL_RE = re.compile(r"\w+\.\w+\(.*\)")
+SYRA_CALL_RE = re.compile(r"(\w+)\((.*)\)")
+
+def _unknown_line(line):
     print(f"Comando desconhecido: {line}")
-    return True
 
-def execute_line(line):
-    line = line.strip()
-    if not line:
-        return
-        
-    # Novo handler para comandos com &
-    if line.startswith("&"):
-        if process_ampersand_command(line):
-            return
-            
-    # Bloco de classe
-    if line.startswith("class "):
-        class_block = [line]
-        while True:
-            try:
-                next_line = input("... ")
-                if not next_line.strip():
-                    break
-                class_block.append(next_line)
-            except EOFError:
-                break
-        cmd_class("\n".join(class_block))
-        return
-    # Detecta definição de função Syra (com ou sem decorador)
-    if re.match(r"(@\w+\s*)*\w+\s*\(.*\)\s+is(\s|:|->)", line):
-        func_lines = [line]
-        # Coleta linhas do bloco, se terminar com ':'
-        if line.strip().endswith(":"):
-            while True:
-                next_line = input("... ")
-                if not next_line or not next_line.strip():
-                    break
-                func_lines.append(next_line)
-        syra_def.define_syra_function("\n".join(func_lines))
-        return
-    # Função lambda atribuída a variável
-    if re.match(r"\$\w+\s*=\s*\(.*\)\s+is\s+.+", line):
-        var_name, lambda_expr = line.split("=", 1)
-        var_name = var_name.strip()
-        lambda_obj = syra_def.define_syra_lambda(lambda_expr.strip())
-        variables[var_name] = lambda_obj
+def _assign_lambda(var_name, lambda_expr):
+    # O escopo atual é capturado por referência (frame), sem copiar as variáveis
+    variables[var_name] = syra_def.define_syra_lambda(lambda_expr, defining_env=variables)
+
+def _assign_var(var_name, expr_str):
+    # safe_eval também resolve comandos com & (ex: $x = &Syread(...))
+    variables[var_name] = safe_eval(expr_str)
+
+def _call_syra_line(func_name, arg_specs, line):
+    """Chamada de função Syra como instrução; o resultado não-None é exibido."""
+    if func_name not in syra_def.syra_functions:
+        _unknown_line(line)
         return
-    # Detecta definição de função Syra
-    if re.match(r"\w+\s*\(.*\)\s+is(\s|:|->)", line):
-        # Bloco de função
-        if line.strip().endswith(":"):
-            func_block = [line]
-            while True:
-                try:
-                    next_line = input("... ")
-                    if not next_line.strip():
-                        break
-                    func_block.append(next_line)
-                except EOFError:
-                    break
-            syra_def.define_syra_function("\n".join(func_block))
+    args = []
+    kwargs = {}
+    for key, value in arg_specs:
+        if key is None:
+            args.append(safe_eval(value))
         else:
-            # Função de expressão única
-            syra_def.define_syra_function(line)
-        return
-    # Instanciação OO
-    if re.match(r"\$\w+\s*=\s*\w+\(.*\)", line):
-        cmd_new(line)
-        return
-    # Chamada de método OO
-    if re.match(r"\$\w+\.\w+\(.*\)", line):
-        cmd_call(line)
-        return
+            kwargs[key] = safe_eval(value)
+    result = syra_def.call_syra_function(func_name, *args, **kwargs)
+    if result is not None:
+        print(result)
+
+def classify_line(line):
+    """
+    Decide qual handler executa a linha. Retorna (handler, args).
+    A ordem das regras é a do interpretador original; o primeiro caractere
+    da linha descarta de imediato as regras que não podem casar.
+    """
+    first = line[0]
+    # Comandos com & (case-insensitive para o nome)
+    if first == "&":
+        m = AMP_COMMAND_RE.match(line)
+        if m:
+            for cmd_key in (f"&{m.group(1)}", f"&{m.group(1).lower()}"):
+                if cmd_key in commands:
+                    return commands[cmd_key], (m.group(2),)
+            return _unknown_line, (line,)
+    if first == "$":
+        # Função lambda atribuída a variável
+        if LAMBDA_ASSIGN_RE.match(line):
+            var_name, lambda_expr = line.split("=", 1)
+            return _assign_lambda, (var_name.strip(), lambda_expr.strip())
+        # Instanciação OO
+        if NEW_RE.match(line):
+            return cmd_new, (line,)
+        # Chamada de método OO
+        if METHOD_CALL_RE.match(line):
+            return cmd_call, (line,)
+    else:
+        # Definição de classe em uma linha (blocos completos chegam via AST)
+        if line.startswith("class "):
+            return cmd_class, (line,)
+        # Detecta definição de função Syra (com ou sem decorador)
+        if FUNC_DEF_RE.match(line):
+            return syra_def.define_syra_function, (line,)
     # Executa comandos (prioritário!)
-    for cmd in commands:
-        if line.startswith(cmd + "(") and line.endswith(")"):
-            args = line[len(cmd):].strip()
-            commands[cmd](args)
-            return
-        elif line.startswith(cmd + " "):
-            args = line[len(cmd):].strip()
-            commands[cmd](args)
-            return
-        elif line == cmd:
-            commands[cmd]("")
-            return
-    # Comandos de importação
-    if line.startswith("expor "):
-        cmd_expor(line[6:])
-        return
-    if line.startswith("from ") and " expor " in line:
-        cmd_from_expor(line[5:])
-        return
+    found = commands.match(line)
+    if found:
+        cmd, args = found
+        return commands[cmd], (args,)
+    if first == "$":
+        # Variáveis e comandos normais
+        if "=" in line:
+            var_name, expr_str = line.split("=", 1)
+            return _assign_var, (var_name.strip(), expr_str.strip())
+        return execute_dollar_declaration, (line,)
     # Chamada de método estático (só se não for comando Syra)
-    if re.match(r"\w+\.\w+\(.*\)", line):
-        cmd_static(line)
-        return
-    # Variáveis e comandos normais
-    if line.startswith("$"):
-        execute_dollar_declaration(line)
-        return
-
-    # Chamada de função Syra
-    m = re.match(r"(\w+)\((.*)\)", line)
-    if m and m.group(1) in syra_def.syra_functions:
-        func_name = m.group(1)
-        params_str = m.group(2)
-        
-        # Transformar parâmetros
-        args = []
-        kwargs = {}
-        
-        if params_str.strip():
-            param_parts = params_str.split(',')
-            for part in param_parts:
+    if STATIC_CALL_RE.match(line):
+        return cmd_static, (line,)
+    # Chamada de função Syra (a existência da função é verificada na execução)
+    m = SYRA_CALL_RE.match(line)
+    if m:
+        arg_specs = []
+        if m.group(2).strip():
+            for part in m.group(2).split(','):
                 part = part.strip()
                 if '=' in part:
                     key, value = part.split('=', 1)
-                    kwargs[key.strip()] = safe_eval(value.strip())
+                    arg_specs.append((key.strip(), value.strip()))
                 else:
-                    args.append(safe_eval(part))
-        
-        result = syra_def.call_syra_function(func_name, *args, **kwargs)
-        if result is not None:
-            print(result)
-        return
+                    arg_specs.append((None, part))
+        return _call_syra_line, (m.group(1), tuple(arg_specs), line)
+    return _unknown_line, (line,)
 
-    print(f"Comando desconhecido: {line}")
+def execute_line(line):
+    global _line_cache_version
+    line = line.strip()
+    if not line:
+        return
+    if _line_cache_version != commands.version:
+        # Comandos foram (re)registrados: classificações antigas podem estar erradas
+        _line_cache.clear()
+        _line_cache_version = commands.version
+    entry = _line_cache.get(line)
+    if entry is None:
+        entry = classify_line(line)
+        _line_cache[line] = entry
+        if len(_line_cache) > LINE_CACHE_SIZE:
+            _line_cache.popitem(last=False)
+    else:
+        _line_cache.move_to_end(line)
+    handler, args = entry
+    handler(*args)
 
 # execute_dollar_declaration
 def execute_dollar_declaration(line):
@@ -362,93 +340,303 @@ def execute_dollar_declaration(line):
         return True
     return False
 
-# Em safe_eval no func.py
+# ===== Avaliação de expressões =====
+
+EXPR_CACHE_SIZE = 2048  # Máximo de expressões compiladas mantidas no cache (LRU)
+_expr_cache = OrderedDict()  # {texto_da_expressão: entrada compilada}
+expr_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+SYRA_VAR_RE = re.compile(r"\$\w+")
+RUN_ORV_RE = re.compile(r"&run\s+(.*?)\s+orv\s+(.*)", re.IGNORECASE)
+AMP_COMMAND_RE = re.compile(r"&(\w+)\s*\((.*)\)")
+AMP_CALL_RE = re.compile(r"&(\w+)\s*\(")
+FIND_RE = re.compile(r"^find\s+(\w+)(?:\s+where\s+(.+))?$")
+FIND_CONDITION_RE = re.compile(r"^(\w+)\s*(==|!=|>=|<=|>|<)\s*(.+)$")
+FIND_AND_RE = re.compile(r"\s+and\s+")
+
+def _split_find_conditions(text):
+    """Divide `a == 1 and b == "x and y"` nos `and` fora de strings (como prs.strip_comment)."""
+    parts = []
+    quote = None
+    start = i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch.isspace():
+            sep = FIND_AND_RE.match(text, i)
+            if sep:
+                parts.append(text[start:i])
+                start = i = sep.end()
+                continue
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+SAFE_BUILTINS = {
+    "True": True, "False": False, "None": None,
+    "int": int, "float": float, "str": str, "len": len,
+    "sum": sum, "min": min, "max": max,  # Agregações sobre colunas (&SyBulk)
+    # Add any other Python built-ins you want to expose safely
+}
+
+def _sub_outside_strings(pattern, repl, text):
+    """pattern.sub só fora dos literais de string, com o mesmo scanner de prs.strip_comment."""
+    parts = []
+    quote = None
+    start = i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+                parts.append(text[start:i + 1]) # O literal fica como foi escrito
+                start = i + 1
+        elif ch in ("'", '"'):
+            parts.append(pattern.sub(repl, text[start:i]))
+            start = i
+            quote = ch
+        i += 1
+    parts.append(text[start:] if quote else pattern.sub(repl, text[start:]))
+    return "".join(parts)
+
+def _syra_var_name(var_syra_name):
+    """Nome Python usado no código compilado para a variável Syra ($x -> __syra_x)."""
+    return "__syra_" + var_syra_name[1:]
+
+def _command_key(cmd_name):
+    # Check for registered command (case-sensitive and then case-insensitive for the key)
+    for cmd_key in (f"&{cmd_name}", f"&{cmd_name.lower()}"):
+        if cmd_key in commands:
+            return cmd_key
+    return None
+
+def _closing_paren(expr, start):
+    """Posição do `)` que fecha o `(` aberto antes de start, ignorando strings."""
+    depth = 1
+    quote = None
+    i = start
+    n = len(expr)
+    while i < n:
+        ch = expr[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return None
+
+def _command_calls(expr):
+    """Chamadas &Cmd(...) registradas fora de strings: [(início, fim, chave, args)]."""
+    calls = []
+    quote = None
+    i = 0
+    n = len(expr)
+    while i < n:
+        ch = expr[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == "&":
+            m = AMP_CALL_RE.match(expr, i)
+            cmd_key = m and _command_key(m.group(1))
+            end = cmd_key and _closing_paren(expr, m.end())
+            if end:
+                calls.append((i, end + 1, cmd_key, expr[m.end():end].strip()))
+                i = end + 1
+                continue
+        i += 1
+    return calls
+
+def _compile_expr(expr):
+    """
+    Classifica e compila uma expressão uma única vez.
+    Retorna ("run", tentativa, fallback), ("cmd", nome, args),
+    ("find", classe, condições) ou
+    ("expr", code, variáveis_syra_referenciadas, comandos_aninhados).
+    """
+    run_orv_match = RUN_ORV_RE.match(expr)
+    if run_orv_match:
+        return ("run", run_orv_match.group(1).strip(), run_orv_match.group(2).strip())
+
+    # A expressão inteira é um comando registrado; &nome(...) desconhecido segue para o eval
+    nested = _command_calls(expr)
+    if len(nested) == 1 and nested[0][0] == 0 and nested[0][1] == len(expr):
+        return ("cmd", nested[0][2], nested[0][3])
+
+    find_match = FIND_RE.match(expr)
+    if find_match:
+        # find Pessoa where idade > 30 and nome == "Ana"
+        conditions = []
+        if find_match.group(2):
+            for part in _split_find_conditions(find_match.group(2).strip()):
+                condition = FIND_CONDITION_RE.match(part.strip())
+                if not condition:
+                    raise SyntaxError(f"Condição inválida em find: '{part.strip()}'")
+                conditions.append(condition.groups())
+        return ("find", find_match.group(1), tuple(conditions))
+
+    syra_vars = []
+    def syra_var_replacer(match):
+        var_syra_name = match.group(0) # e.g., $e
+        if var_syra_name not in syra_vars:
+            syra_vars.append(var_syra_name)
+        return _syra_var_name(var_syra_name)
+
+    # &Cmd(...) dentro da expressão vira __syra_cmd_N(), executado só quando avaliado
+    for n, (start, end, _, _) in reversed(list(enumerate(nested))):
+        expr = f"{expr[:start]}__syra_cmd_{n}(){expr[end:]}"
+
+    # '"Erro: " + $e' vira '"Erro: " + __syra_e'; o valor é ligado na hora do eval.
+    # Dentro de strings, $nome é texto comum e não é reescrito
+    code = compile(_sub_outside_strings(SYRA_VAR_RE, syra_var_replacer, expr), "<syra>", "eval")
+    return ("expr", code, tuple(syra_vars), tuple((key, args) for _, _, key, args in nested))
+
+def _lookup_expr(expr):
+    entry = _expr_cache.get(expr)
+    if entry is not None:
+        expr_cache_stats["hits"] += 1
+        _expr_cache.move_to_end(expr)
+        return entry
+    expr_cache_stats["misses"] += 1
+    entry = _compile_expr(expr)
+    _expr_cache[expr] = entry
+    if len(_expr_cache) > EXPR_CACHE_SIZE:
+        _expr_cache.popitem(last=False)
+        expr_cache_stats["evictions"] += 1
+    return entry
+
 def safe_eval(expr):
     expr = expr.strip()
+    entry = _lookup_expr(expr)
+    kind = entry[0]
 
     # Special handling for &run ... orv ... expressions
-    # This part should be robust. If `operacao()` is not defined, safe_eval(operacao()) will raise an error.
-    run_orv_match = re.match(r"&run\s+(.*?)\s+orv\s+(.*)", expr, re.IGNORECASE)
-    if run_orv_match:
-        try_expr = run_orv_match.group(1).strip()
-        fallback_expr = run_orv_match.group(2).strip()
+    if kind == "run":
         try:
-            return safe_eval(try_expr)  # Evaluate the expression to try
+            return safe_eval(entry[1])  # Evaluate the expression to try
         except Exception:
-            return safe_eval(fallback_expr) # Evaluate the fallback expression
+            return safe_eval(entry[2]) # Evaluate the fallback expression
 
     # Handle other & commands like &Syope(args), &Syread(args)
-    # This assumes commands like &Syope return a value that safe_eval should return.
-    command_match = re.match(r"&(\w+)\s*\((.*)\)", expr)
-    if command_match:
-        cmd_name = command_match.group(1)
-        cmd_args = command_match.group(2).strip() # Arguments string
-        
-        # Check for registered command (case-sensitive and then case-insensitive for the key)
-        cmd_key_exact = f"&{cmd_name}"
-        cmd_key_lower = f"&{cmd_name.lower()}" # Assuming commands might be registered lowercase
-
-        if cmd_key_exact in commands:
-            return commands[cmd_key_exact](cmd_args)
-        elif cmd_key_lower in commands:
-            return commands[cmd_key_lower](cmd_args)
-        # If command not found but matched pattern, it could be an error or unhandled case
-        # For now, let it fall through, but ideally, this might raise an "unknown &command" error.
-
-    # Substitute Syra variables ($nome) with their Python literal representations
-    def syra_var_replacer(match):
-        var_syra_name = match.group(0) # e.g., $e
-        if var_syra_name in variables: # `variables` is your global Syra variables dictionary
-            val = variables[var_syra_name]
-            if isinstance(val, str):
-                # Create a valid Python string literal, correctly escaping internal quotes
-                return '"' + val.replace('\\', '\\\\').replace('"', '\\"') + '"'
-            elif isinstance(val, bool):
-                return str(val) # "True" or "False"
-            elif isinstance(val, (int, float)):
-                return str(val) # Numbers as strings
-            elif val is None:
-                return "None"
-            else:
-                # For other types (lists, dicts), converting to string might not be directly evaluatable
-                # in a simple Python expression unless they are already in Python literal format.
-                # For this specific case ("Erro: " + $e), $e is a string.
-                return str(val) # Fallback, might need refinement for complex types
-        else:
+    if kind == "cmd":
+        return commands[entry[1]](entry[2])
+
+    if kind == "find":
+        # Os valores das condições podem usar $vars: avaliados a cada consulta
+        conditions = [(field, op, safe_eval(value)) for field, op, value in entry[2]]
+        return obj.find_objects(entry[1], conditions)
+
+    # Propagate exceptions (e.g., ZeroDivisionError from '1/0', or NameError if
+    # 'operacao()' is undefined) so &attempt/&rescue and &run/orv can catch them.
+    # As $vars ficam em uma camada sobre o namespace compartilhado das funções
+    # Syra (deff.syra_namespace); a camada vale também dentro de comprehensions.
+    code, syra_vars, nested = entry[1], entry[2], entry[3]
+    # Por último, os nomes exportados de módulos Python (imp.exports, resolvidos sob demanda)
+    eval_env = syra_def.SyraNamespace(parent=imp.exports, scope=syra_def.syra_namespace)
+    eval_env["__builtins__"] = SAFE_BUILTINS
+    for var_syra_name in syra_vars:
+        if var_syra_name not in variables:
             # This should ideally raise a Syra-specific runtime error
             raise NameError(f"Variável Syra '{var_syra_name}' não definida.")
-
-    # Apply the replacer to the expression string
-    # This will turn ' "Erro: " + $e ' into ' "Erro: " + "division by zero" '
-    expr_after_syra_vars = re.sub(r"\$\w+", syra_var_replacer, expr)
-
-    # Python eval for the final expression string
+        # O próprio objeto é ligado ao eval (O(1), sem str()/reparse do valor)
+        eval_env[_syra_var_name(var_syra_name)] = variables[var_syra_name]
+    for n, (cmd_key, cmd_args) in enumerate(nested):
+        eval_env[f"__syra_cmd_{n}"] = functools.partial(commands[cmd_key], cmd_args)
+    return eval(code, eval_env)
+
+def expr_cache_info():
+    """Estatísticas do cache de expressões compiladas."""
+    return {**expr_cache_stats, "size": len(_expr_cache), "maxsize": EXPR_CACHE_SIZE}
+
+def cmd_sycache(args):
+    """Comando &SyCache(): retorna hits/misses/evictions do cache de expressões."""
+    return expr_cache_info()
+
+commands["&SyCache"] = cmd_sycache
+commands["&sycache"] = cmd_sycache
+
+def cmd_symemo(args):
+    """
+    Comando &SyMemo(): estatísticas das funções @memo (hits/misses/evictions).
+    &SyMemo("nome") retorna só as da função indicada.
+    """
+    if not args.strip():
+        return {name: memo_func.cache_info() for name, memo_func in syra_def.memo_functions.items()}
+    name = safe_eval(args)
+    if name not in syra_def.memo_functions:
+        return f"[AVISO] Função '{name}' não usa @memo"
+    return syra_def.memo_functions[name].cache_info()
+
+commands["&SyMemo"] = cmd_symemo
+commands["&symemo"] = cmd_symemo
+
+def cmd_syobjs(args):
+    """
+    Comando &SyObjs(): quantidade de objetos vivos por classe.
+    &SyObjs("Pessoa") retorna só a contagem da classe indicada.
+    &SyObjs(collect=True) coleta ciclos inalcançáveis antes de contar.
+    """
+    if not args.strip():
+        return obj.live_objects()
     try:
-        # The expression is now a Python-compatible string, e.g., '"Erro: " + "division by zero"'
-        # or a simple literal like '"falha"' or a number like '123'
-        
-        safe_globals = {
-            "__builtins__": {
-                "True": True, "False": False, "None": None,
-                "int": int, "float": float, "str": str, "len": len
-                # Add any other Python built-ins you want to expose safely
-            }
-        }
-        
-        # The `locals` for eval. Since Syra variables are substituted into the expression string
-        # as literals, we don't need to pass Syra's `variables` dict here for $var resolution.
-        # Passing an empty dict or a controlled context is safer.
-        python_eval_locals = {} 
-
-        # eval() will compute '"Erro: " + "division by zero"' to the string "Erro: division by zero"
-        # eval('"falha"') will result in the string "falha"
-        # eval('1/0') will raise ZeroDivisionError
-        return eval(expr_after_syra_vars, safe_globals, python_eval_locals)
-        
-    except Exception as e:
-        # Propagate the exception (e.g., ZeroDivisionError from '1/0', or NameError if 'operacao()' is undefined)
-        # This allows &attempt/&rescue and &run/orv to catch it.
-        raise e
+        params, options = tps._call_args(args)
+    except SyntaxError as e:
+        return f"[ERRO] SyObjs: {e}"
+    return obj.live_objects(*params, **options)
+
+commands["&SyObjs"] = cmd_syobjs
+commands["&syobjs"] = cmd_syobjs
+
+def cmd_sybulk(args):
+    """
+    Comando &SyBulk(Classe, $linhas): cria instâncias em massa em colunas.
+    Exemplo: $pessoas = &SyBulk(Pessoa, [("Ana", 30), ("João", 25)])
+    """
+    parts = args.split(",", 1)
+    if len(parts) < 2:
+        return "[ERRO] SyBulk requer dois argumentos: Classe, linhas"
+    class_name = parts[0].strip()
+    if class_name not in obj.syra_classes:
+        class_name = safe_eval(class_name)
+    return obj.bulk_instantiate(class_name, safe_eval(parts[1].strip()))
+
+commands["&SyBulk"] = cmd_sybulk
+commands["&sybulk"] = cmd_sybulk
+
+def cmd_syquiet(args):
+    """Comando &SyQuiet(True|False): liga/desliga os avisos de nome sobrescrito do `expor`."""
+    imp.quiet_imports = bool(safe_eval(args)) if args.strip() else True
+    return imp.quiet_imports
+
+commands["&SyQuiet"] = cmd_syquiet
+commands["&syquiet"] = cmd_syquiet
 
 def parse_match_cases(lines):
     cases = []
@@ -508,62 +696,84 @@ def cmd_match(args):
 commands["match"] = cmd_match
 
 def cmd_each(args):
-    header, *block_lines = args.split('\n')
-    header = header.strip()
-    block = [line for line in block_lines if line.strip()]
-    if not header.endswith(":") or not block:
-        print("Erro de sintaxe em each.")
-        return
-
-    header = header[:-1].strip()
-    m = re.match(r"each\s+(\([^)]+\)|\$\w+)\s+in\s+(.+)", header)
-    if not m:
+    nodes = prs.parse(args)
+    if len(nodes) != 1 or not isinstance(nodes[0], prs.EachBlock) or not nodes[0].body:
         print("Erro de sintaxe em each.")
         return
-    var_part, iterable_expr = m.groups()
-    iterable_expr = iterable_expr.strip()
+    run_each(nodes[0])
+
+EACH_RANGE_RE = re.compile(r"^([\w$]+)\s*\.\.\s*([\w$]+)$")
+
+def compile_nodes(nodes):
+    """
+    Prepara nós para execução repetida (corpo de laços): cada instrução
+    simples já sai classificada como (handler, args), sem passar de novo
+    pelo despacho de execute_line a cada iteração.
+    """
+    steps = []
+    for node in nodes:
+        if type(node) is prs.Stmt:
+            steps.append(classify_line(node.text))
+        else:
+            steps.append((node_handlers[type(node)], (node,)))
+    return steps
 
-    range_match = re.match(r"(\d+)\.\.(\d+)", iterable_expr)
+def _each_iterable(iterable_expr):
+    """Resolve o iterável do each sem materializá-lo (ranges e geradores são preguiçosos)."""
+    range_match = EACH_RANGE_RE.match(iterable_expr)
     if range_match:
-        start, end = int(range_match.group(1)), int(range_match.group(2))
-        iterable = range(start, end + 1)
-    else:
-        if iterable_expr.startswith("$"):
-            iterable = variables.get(iterable_expr, [])
-        else:
-            iterable = safe_eval(iterable_expr)
-        if not hasattr(iterable, "__iter__"):
-            print(f"'{iterable_expr}' não é iterável.")
-            return
+        start, end = (safe_eval(part) for part in range_match.groups())
+        return range(int(start), int(end) + 1)
+    if iterable_expr.startswith("$") and SYRA_VAR_RE.fullmatch(iterable_expr):
+        return variables.get(iterable_expr, [])
+    return safe_eval(iterable_expr)
+
+def run_each(node):
+    """Executa um nó EachBlock com o corpo compilado uma vez (compile_nodes)."""
+    var_part = node.var_part
+    iterable_expr = node.iterable_expr
+
+    iterable = _each_iterable(iterable_expr)
+    if not hasattr(iterable, "__iter__"):
+        print(f"'{iterable_expr}' não é iterável.")
+        return
 
     if var_part.startswith("(") and var_part.endswith(")"):
-        var_names = [v.strip() for v in var_part[1:-1].split(",")]
-        use_index = True
+        var_names = ["$" + v.strip().lstrip("$") for v in var_part[1:-1].split(",")]
+        if len(var_names) != 2:
+            print("Erro: use ($i, $item) para índice e valor.")
+            return
+        index_var, item_var = var_names
     else:
-        var_names = [var_part.strip()]
-        use_index = False
-
-    for idx, item in enumerate(iterable):
-        local_vars = {}
-        if use_index:
-            if len(var_names) == 2:
-                local_vars[var_names[0].lstrip("$")] = idx
-                local_vars[var_names[1].lstrip("$")] = item
-            else:
-                print("Erro: use ($i, $item) para índice e valor.")
-                return
-        else:
-            local_vars[var_names[0].lstrip("$")] = item
-
-        old_vars = {k: variables.get(k) for k in local_vars}
-        variables.update(local_vars)
-        for code_line in block:
-            execute_line(code_line)
-        for k in local_vars:
-            if old_vars[k] is not None:
-                variables[k] = old_vars[k]
-            else:
+        var_names = ["$" + var_part.strip().lstrip("$")]
+        index_var, item_var = None, var_names[0]
+
+    # O corpo compilado fica no próprio nó e é refeito se comandos mudarem
+    version = commands.version
+    steps = node.__dict__.get("_steps")
+    if steps is None or node._steps_version != version:
+        steps = node._steps = compile_nodes(node.body)
+        node._steps_version = version
+
+    missing = object()
+    old_vars = {k: variables.get(k, missing) for k in var_names}
+    try:
+        for idx, item in enumerate(iterable):
+            if index_var:
+                variables[index_var] = idx
+            variables[item_var] = item
+            for handler, args in steps:
+                handler(*args)
+            if commands.version != version:
+                version = commands.version
+                steps = node._steps = compile_nodes(node.body)
+                node._steps_version = version
+    finally:
+        for k, old in old_vars.items():
+            if old is missing:
                 variables.pop(k, None)
+            else:
+                variables[k] = old
 
 commands["each"] = cmd_each
 
@@ -579,6 +789,10 @@ def cmd_new(args):
         print("Sintaxe: $var = Classe(arg1, arg2)")
         return
     var, class_name, params = m.groups()
+    if class_name not in obj.syra_classes and class_name in syra_def.syra_namespace:
+        # Não é classe: chamada de função comum (ex: $x = soma(2, 3))
+        variables[var] = safe_eval(args.split("=", 1)[1])
+        return
     param_list = [safe_eval(p.strip()) for p in params.split(",")] if params.strip() else []
     obj_id = obj.instantiate(class_name, *param_list)
     if obj_id:
@@ -593,6 +807,9 @@ def cmd_call(args):
         return
     var, method, params = m.groups()
     obj_id = variables.get(var)
+    if not isinstance(obj_id, (str, obj.SyraObject)) and hasattr(obj_id, method):
+        # Valor Python com esse método (ex: tabela Syra): chamada comum
+        return safe_eval(args)
     if not obj_id:
         print(f"Objeto '{var}' não encontrado.")
         return
@@ -611,106 +828,44 @@ def cmd_static(args):
     obj.static_call(class_name, method, *param_list)
 commands["static"] = cmd_static
 
+def run_attempt(node):
+    """Executa um nó AttemptBlock: erros do corpo desviam para o &rescue."""
+    try:
+        execute_nodes(node.body)
+    except Exception as exc:
+        variables["$" + node.rescue_var] = str(exc)
+        execute_nodes(node.rescue_body)
+
+# Executores de cada tipo de nó da AST (prs.py)
+node_handlers = {
+    prs.Stmt: lambda node: execute_line(node.text),
+    prs.FuncDef: lambda node: syra_def.define_syra_function(node.source),
+    prs.ClassDef: lambda node: obj.define_class(node.source),
+    prs.MatchBlock: lambda node: cmd_match(node.source),
+    prs.EachBlock: run_each,
+    prs.AttemptBlock: run_attempt,
+}
+
+def execute_node(node):
+    node_handlers[type(node)](node)
+
+def execute_nodes(nodes):
+    for node in nodes:
+        node_handlers[type(node)](node)
+
 def run_syra_file(filename):
-    with open(filename, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Skip empty lines and comments
-        if not line or line.startswith('//'):
-            i += 1
-            continue
-            
-        # Check for attempt/rescue blocks
-        if line.lower().startswith('&attempt:'):
-            # Collect the block
-            attempt_block = []
-            attempt_block.append(lines[i])  # Add &attempt: line
-            
-            i += 1  # Move to next line
-            # Collect attempt body until &rescue or end of indented block
-            while i < len(lines):
-                current = lines[i].strip()
-                if current.lower().startswith('&rescue'):
-                    break
-                if not current:  # Empty line
-                    i += 1
-                    continue
-                attempt_block.append(lines[i])
-                i += 1
-                
-            # Now collect the rescue part
-            if i < len(lines) and lines[i].strip().lower().startswith('&rescue'):
-                attempt_block.append(lines[i])  # Add &rescue line
-                i += 1
-                # Collect rescue body
-                while i < len(lines):
-                    if not lines[i].strip():  # Empty line
-                        i += 1
-                        continue
-                    # Check if we're still in the indented block
-                    indentation = len(lines[i]) - len(lines[i].lstrip())
-                    if indentation == 0 and lines[i].strip():
-                        break  # No longer in the rescue block
-                    attempt_block.append(lines[i])
-                    i += 1
-            
-            # Process the entire block
-            tps.cmd_attempt_block(attempt_block)
-        else:
-            # Process normal line
-            execute_line(line)
-            i += 1
+    # O arquivo inteiro é analisado uma única vez e depois executado nó a nó
+    try:
+        nodes = prs.parse_file(filename)
+    except SyntaxError as e:
+        print(f"[Erro Syra] Erro de sintaxe em '{filename}': {e}")
+        return
+    execute_nodes(nodes)
 
 def run_syra_code(code_block_str): # code_block_str pode ser uma ou múltiplas linhas
-    lines = code_block_str.splitlines()
-    
-    # Tenta identificar se o bloco inteiro é uma definição única (classe, função, match, each)
-    # Esta lógica é para quando o REPL envia um bloco coletado.
-    if lines:
-        first_line_cleaned = lines[0].strip()
-        if "//" in first_line_cleaned:
-            first_line_cleaned = first_line_cleaned.split("//", 1)[0].strip()
-
-        if first_line_cleaned: # Procede apenas se a primeira linha limpa não for vazia
-            if first_line_cleaned.startswith("class "):
-                obj.define_class(code_block_str) # Passa o bloco original
-                return
-            elif first_line_cleaned.startswith("@") or re.match(r"^\w+\s*\(.*\)\s+is(\s|:|->)", first_line_cleaned):
-                syra_def.define_syra_function(code_block_str) # Passa o bloco original
-                return
-            elif re.match(r"(\$?\w+)\s*=\s*match\s+([^\:]+)\s*:", first_line_cleaned):
-                cmd_match(code_block_str) # Passa o bloco original
-                return
-            elif re.match(r"each\s+(\([^)]+\)|\$\w+)\s+in\s+.+:", first_line_cleaned):
-                cmd_each(code_block_str) # Passa o bloco original
-                return
-    
-    # Se não for um bloco único reconhecido acima, processa linha por linha
-    # (útil se run_syra_code for chamado com múltiplas linhas que não formam um único bloco Syra)
-    i = 0
-    while i < len(lines):
-        line_for_logic = lines[i].strip()
-        if "//" in line_for_logic:
-            line_for_logic = line_for_logic.split("//", 1)[0].strip()
-        
-        if not line_for_logic:
-            i += 1
-            continue
-        
-        # Definição de lambda em uma linha (não precisa de tratamento de bloco especial aqui)
-        if re.match(r"\$\w+\s*=\s*\(.*\)\s+is\s+.+", line_for_logic):
-            var_name, lambda_expr_str = line_for_logic.split("=", 1)
-            var_name = var_name.strip()
-            lambda_expr_str = lambda_expr_str.strip()
-            try:
-                lambda_obj = syra_def.define_syra_lambda(lambda_expr_str, defining_env=variables.copy())
-                variables[var_name] = lambda_obj
-            except Exception as e_lambda:
-                print(f"Erro ao definir lambda para '{var_name}': {e_lambda}")
-        else:
-            execute_line(line_for_logic) # Passa a linha limpa
-        i += 1
+    try:
+        nodes = prs.parse(code_block_str)
+    except SyntaxError as e:
+        print(f"Erro de sintaxe: {e}")
+        return
+    execute_nodes(nodes)
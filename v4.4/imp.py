@@ -1,8 +1,73 @@
 import importlib
+import os
 import traceback
 
 ALLOWED_MODULES = {"math", "random", "sys", "os", "json"}  # Adapte conforme desejar
 _module_cache = {}
+quiet_imports = bool(os.environ.get("SYRA_QUIET_IMPORTS"))  # Silencia os avisos de nome sobrescrito
+
+class LazyModule:
+    """
+    Proxy de um módulo Python exportado com `expor`. Os atributos são
+    resolvidos no primeiro acesso e guardados no próprio proxy; nada é
+    copiado na importação, então o custo não depende do tamanho do módulo.
+    """
+    def __init__(self, module):
+        object.__setattr__(self, "_module", module)
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        object.__setattr__(self, name, value)  # Próximos acessos não passam por aqui
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._module, name, value)
+        object.__setattr__(self, name, value)
+
+    def __dir__(self):
+        return dir(self._module)
+
+    def __repr__(self):
+        return f"<módulo Python '{self._module.__name__}' (lazy)>"
+
+class ExportNamespace(dict):
+    """
+    Nomes exportados de módulos Python, vistos pelas expressões Syra.
+    Guarda os módulos e símbolos importados por nome; os nomes de um
+    `expor modulo` sem lista são procurados nos módulos só quando usados
+    (o último módulo exportado tem prioridade) e então memorizados.
+    """
+    def __init__(self):
+        super().__init__()
+        self.star_modules = []  # LazyModule em ordem de exportação
+        self._resolved = {}
+
+    def add_star(self, proxy):
+        self.star_modules.append(proxy)
+        self._resolved.clear()
+
+    def __missing__(self, name):
+        if name in self._resolved:
+            return self._resolved[name]
+        if not name.startswith("_"):
+            for proxy in reversed(self.star_modules):
+                if hasattr(proxy._module, name):
+                    value = self._resolved[name] = getattr(proxy, name)
+                    return value
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        try:
+            self[name]
+            return True
+        except KeyError:
+            return False
+
+exports = ExportNamespace()
+
+def _warn_overwrite(name, syra_globals, quiet_mode):
+    if not quiet_mode and name in syra_globals:
+        print(f"[Aviso Syra] '{name}' já está definido e será sobrescrito.")
 
 def _resolve_attr_chain(obj, chain):
     """Resolve uma cadeia de atributos separada por ponto, ex: der.ccos."""
@@ -23,15 +88,17 @@ def import_plugin_if_available(mod, syra_globals):
         return True
     return False
 
-def syra_expor(module_name, syra_globals, names=None, aliases=None, alias=None, debug=False):
+def syra_expor(module_name, syra_globals, names=None, aliases=None, alias=None, debug=False, quiet=None):
     """
     Importa módulos ou símbolos específicos no escopo da Syra, com suporte a alias e plugins.
     - module_name: nome do módulo Python
     - syra_globals: dicionário de variáveis globais Syra
-    - names: lista de nomes/símbolos a importar (ou None para tudo)
+    - names: lista de nomes/símbolos a importar (ou None para tudo, via LazyModule)
     - aliases: lista de aliases para os nomes (ou None)
     - alias: alias para o módulo inteiro (ou None)
+    - quiet: silencia os avisos de nome sobrescrito (None usa imp.quiet_imports)
     """
+    quiet_mode = quiet if quiet is not None else quiet_imports
     try:
         if module_name not in ALLOWED_MODULES:
             raise ImportError(f"O módulo '{module_name}' não é permitido.")
@@ -44,24 +111,22 @@ def syra_expor(module_name, syra_globals, names=None, aliases=None, alias=None,
 
         # Importação direta do módulo com alias (ex: expor math as m)
         if names is None:
+            # Só o proxy é registrado; os atributos são resolvidos quando usados
             name_key = alias or module_name
-            if name_key in syra_globals:
-                print(f"[Aviso Syra] '{name_key}' já está definido e será sobrescrito.")
-            syra_globals[name_key] = mod
-            for attr in dir(mod):
-                if not attr.startswith("_"):
-                    if attr in syra_globals:
-                        print(f"[Aviso Syra] '{attr}' já está definido e será sobrescrito.")
-                    syra_globals[attr] = getattr(mod, attr)
+            _warn_overwrite(name_key, syra_globals, quiet_mode)
+            proxy = LazyModule(mod)
+            syra_globals[name_key] = proxy
+            exports[name_key] = proxy
+            exports.add_star(proxy)
         else:
             for idx, name in enumerate(names):
                 alias_name = aliases[idx] if aliases and idx < len(aliases) else name.split('.')[-1]
-                if alias_name in syra_globals:
-                    print(f"[Aviso Syra] '{alias_name}' já está definido e será sobrescrito.")
+                _warn_overwrite(alias_name, syra_globals, quiet_mode)
                 value = _resolve_attr_chain(mod, name) if '.' in name else getattr(mod, name, None)
                 if value is None:
                     raise AttributeError(f"'{name}' não encontrado em '{module_name}'")
                 syra_globals[alias_name] = value
+                exports[alias_name] = value
     except Exception as e:
         print(f"[Importação Syra] Erro: {e}")
         if debug:
@@ -1,28 +1,330 @@
+import array
+import bisect
+import gc
+import operator
 import re
-import func
+import weakref
+import cmpl
+import deff as syra_def
 
 # Armazenamento global de classes e objetos
 syra_classes = {}
-syra_objects = {}
+syra_objects = weakref.WeakValueDictionary()  # {N: objeto obj_N}; o objeto vive enquanto alguém o referencia
 syra_object_counter = 0
+class_definitions = []  # Nomes das classes na ordem em que foram definidas pela primeira vez
+class_modules = {}  # {classe: variáveis do módulo que a definiu} (preenchido por load_syra_module)
+_mro_cache = {}  # {classe: (classe, base, base da base, ...)}
+_method_tables = {}  # {classe: {método: SyraMethod}} já com os métodos herdados
+_layouts = {}  # {classe: subclasse de SyraObject com os campos em __slots__}
+_row_layouts = {}  # {classe: visão de linha (SyraObject) sobre um ColumnStore}
+column_stores = weakref.WeakSet()  # ColumnStores vivos (&SyBulk); contam em find e &SyObjs
 
 class SyraObject:
-    def __init__(self, data):
-        self._data = data
-    def __getattr__(self, name):
-        if name in self._data:
-            return self._data[name]
-        print("DEBUG self._data:", self._data)
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-    def __setattr__(self, name, value):
-        if name == "_data":
-            super().__setattr__(name, value)
-        else:
-            self._data[name] = value
+    """
+    Instância de classe Syra. Cada classe ganha uma subclasse gerada por
+    object_layout com os campos declarados em __slots__: ler ou escrever
+    um campo é um acesso direto ao slot, sem passar por código Python.
+    Atributos não declarados vão para o __dict__ da instância.
+    O próprio objeto é o handle guardado nas variáveis Syra e aparece como
+    `obj_N`: quando nenhuma variável, lista ou outro objeto o referencia, ele
+    é coletado e sai de syra_objects (que só guarda uma referência fraca).
+    """
+    _syra_class = None
+    _fields = ()
+    _indexed = {}  # {campo: [FieldIndex]} nas classes com `index campo`
+
+    def __init__(self, data=None):
+        if data:
+            for key, value in data.items():
+                self[key] = value
     def __getitem__(self, key):
-        return self._data[key]
+        if key == "__class__":
+            return self._syra_class
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
     def __setitem__(self, key, value):
-        self._data[key] = value
+        if key == "__class__":
+            self._syra_class = value
+        else:
+            setattr(self, key, value)
+    def __repr__(self):
+        obj_id = getattr(self, "_syra_id", None)
+        return object.__repr__(self) if obj_id is None else f"obj_{obj_id}"
+    __str__ = __repr__
+
+# ===== Índices de campos e consultas (find Classe where ...) =====
+
+INDEX_DECL_RE = re.compile(r"^index\s+(\w+)(?:\s+(hash|sorted))?$")
+_MISSING = object()
+_index_key = operator.itemgetter(0)
+
+class FieldIndex:
+    """
+    Índice de um campo sobre os objetos vivos de uma classe (e subclasses).
+    `hash` responde igualdade; `sorted` responde igualdade e faixas (<, >...).
+    O índice ordenado é uma lista em blocos de até 2*INDEX_LOAD pares
+    (valor, N): inserir e remover custam O(log n + INDEX_LOAD), sem
+    mover a lista inteira. Valores que não cabem na estrutura (None, não
+    hashable ou não comparável) ficam em `unordered` e são conferidos um a um.
+    """
+    INDEX_LOAD = 512
+
+    def __init__(self, field, kind="sorted"):
+        self.field = field
+        self.kind = kind
+        self.buckets = {}  # hash: {valor: {obj_id, ...}}
+        self.blocks = []  # sorted: blocos ordenados de (valor, obj_id)
+        self.maxes = []  # sorted: maior valor de cada bloco
+        self.unordered = {}  # {obj_id: valor}
+
+    def __len__(self):
+        if self.kind == "hash":
+            return sum(len(b) for b in self.buckets.values()) + len(self.unordered)
+        return sum(len(b) for b in self.blocks) + len(self.unordered)
+
+    def add(self, obj_id, value):
+        if value is not None:
+            try:
+                if self.kind == "hash":
+                    self.buckets.setdefault(value, set()).add(obj_id)
+                else:
+                    self._insert(value, obj_id)
+                return
+            except TypeError:
+                pass
+        self.unordered[obj_id] = value
+
+    def load(self, items):
+        """Carga inicial de pares (obj_id, valor) de uma vez, ordenando só uma vez."""
+        if self.kind == "hash" or self.blocks:
+            for obj_id, value in items:
+                self.add(obj_id, value)
+            return
+        pairs = []
+        for obj_id, value in items:
+            if value is None:
+                self.unordered[obj_id] = value
+            else:
+                pairs.append((value, obj_id))
+        try:
+            pairs.sort(key=_index_key)
+        except TypeError:
+            # Tipos não comparáveis entre si: insere um a um
+            for value, obj_id in pairs:
+                self.add(obj_id, value)
+            return
+        load = self.INDEX_LOAD
+        self.blocks = [pairs[i:i + load] for i in range(0, len(pairs), load)]
+        self.maxes = [block[-1][0] for block in self.blocks]
+
+    def _insert(self, value, obj_id):
+        blocks, maxes = self.blocks, self.maxes
+        if not blocks:
+            blocks.append([(value, obj_id)])
+            maxes.append(value)
+            return
+        i = min(bisect.bisect_right(maxes, value), len(blocks) - 1)
+        block = blocks[i]
+        bisect.insort(block, (value, obj_id), key=_index_key)
+        maxes[i] = block[-1][0]
+        load = self.INDEX_LOAD
+        if len(block) > 2 * load:
+            blocks[i:i + 1] = [block[:load], block[load:]]
+            maxes[i:i + 1] = [block[load - 1][0], block[-1][0]]
+
+    def remove(self, obj_id, value):
+        if self.unordered.pop(obj_id, _MISSING) is not _MISSING:
+            return
+        if self.kind == "hash":
+            bucket = self.buckets.get(value)
+            if bucket is not None:
+                bucket.discard(obj_id)
+                if not bucket:
+                    del self.buckets[value]
+            return
+        blocks, maxes = self.blocks, self.maxes
+        i = bisect.bisect_left(maxes, value)
+        # Valores iguais podem se espalhar por blocos vizinhos
+        while i < len(blocks):
+            block = blocks[i]
+            pos = bisect.bisect_left(block, value, key=_index_key)
+            while pos < len(block) and block[pos][0] == value:
+                if block[pos][1] == obj_id:
+                    del block[pos]
+                    if block:
+                        maxes[i] = block[-1][0]
+                    else:
+                        del blocks[i]
+                        del maxes[i]
+                    return
+                pos += 1
+            if pos < len(block):
+                return
+            i += 1
+
+    def _position(self, value, right):
+        """(bloco, posição) do primeiro par com valor > value (right) ou >= value."""
+        search = bisect.bisect_right if right else bisect.bisect_left
+        i = search(self.maxes, value)
+        if i == len(self.blocks):
+            return i, 0
+        return i, search(self.blocks[i], value, key=_index_key)
+
+    def _between(self, lo, hi):
+        blocks = self.blocks
+        (i, pos), (j, end) = lo, hi
+        found = []
+        while i < j:
+            found.extend(obj_id for _, obj_id in blocks[i][pos:])
+            i += 1
+            pos = 0
+        if i < len(blocks):
+            found.extend(obj_id for _, obj_id in blocks[i][pos:end])
+        return found
+
+    def lookup(self, op, value):
+        """Lista de ids (N de obj_N) candidatos para `campo op valor`, ou None se o índice não serve."""
+        if self.kind == "hash":
+            if op != "==":
+                return None
+            try:
+                found = list(self.buckets.get(value, ()))
+            except TypeError:
+                found = []
+        else:
+            start, end = (0, 0), (len(self.blocks), 0)
+            try:
+                if op == "==":
+                    found = self._between(self._position(value, False), self._position(value, True))
+                elif op == ">":
+                    found = self._between(self._position(value, True), end)
+                elif op == ">=":
+                    found = self._between(self._position(value, False), end)
+                elif op == "<":
+                    found = self._between(start, self._position(value, False))
+                elif op == "<=":
+                    found = self._between(start, self._position(value, True))
+                else:
+                    return None
+            except TypeError:
+                found = []
+        return found + list(self.unordered)
+
+def _indexed_setattr(self, name, value):
+    indexes = self._indexed.get(name)
+    if indexes:
+        obj_id = getattr(self, "_syra_id", None)
+        if obj_id is not None:
+            old = getattr(self, name, _MISSING)
+            for index in indexes:
+                if old is not _MISSING:
+                    index.remove(obj_id, old)
+                index.add(obj_id, value)
+    object.__setattr__(self, name, value)
+
+def _indexed_del(self):
+    # Objeto coletado: sai dos índices junto com o registro
+    obj_id = getattr(self, "_syra_id", None)
+    if obj_id is None:
+        return
+    for field, indexes in self._indexed.items():
+        value = getattr(self, field, None)
+        for index in indexes:
+            index.remove(obj_id, value)
+
+QUERY_OPS = {
+    "==": operator.eq, "!=": operator.ne,
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+}
+
+def _matches(live, conditions):
+    for field, op, value in conditions:
+        try:
+            if not QUERY_OPS[op](getattr(live, field), value):
+                return False
+        except (AttributeError, TypeError):
+            return False
+    return True
+
+def find_objects(class_name, conditions):
+    """
+    Objetos vivos da classe (ou subclasses) que atendem a todas as condições
+    [(campo, operador, valor)]. Usa o índice mais seletivo disponível e só
+    varre todos os objetos quando nenhum campo da consulta tem índice.
+    Retorna uma lista de objetos.
+    """
+    if class_name not in syra_classes:
+        print(f"Classe '{class_name}' não definida.")
+        return []
+    indexed = object_layout(class_name)._indexed
+    candidates = None
+    for field, op, value in conditions:
+        for index in indexed.get(field, ()):
+            found = index.lookup(op, value)
+            if found is not None and (candidates is None or len(found) < len(candidates)):
+                candidates = found
+    if candidates is None:
+        candidates = list(syra_objects.keys())
+    results = []
+    for obj_id in candidates:
+        live = syra_objects.get(obj_id)
+        if live is None or class_name not in class_mro(live._syra_class):
+            continue
+        if _matches(live, conditions):
+            results.append(live)
+    # Linhas criadas em massa (&SyBulk): cada ColumnStore tem seus próprios índices
+    for store in list(column_stores):
+        if class_name in class_mro(store.class_name):
+            results.extend(store.find(conditions))
+    return results
+
+_NO_MODULE = {}  # Escopo de módulo vazio compartilhado (classes fora de módulos)
+
+class SyraMethod:
+    """
+    Método de classe Syra preparado em define_class: cabeçalho analisado e
+    corpo compilado uma única vez. A função Python é criada por escopo de
+    módulo e reaproveitada enquanto esse escopo não mudar.
+    """
+    def __init__(self, class_name, name, source, has_base):
+        self.class_name = class_name
+        self.name = name
+        self.source = source
+        self.is_static = source.strip().startswith("static ")
+        self.error = None
+        try:
+            self.code, self.param_names, self.defaults = cmpl.compile_method(source, has_base)
+        except SyntaxError as e:
+            # O erro só aparece quando o método for chamado, como antes
+            self.code, self.param_names, self.defaults = None, [], ()
+            self.error = e
+            print(f"Erro de sintaxe no método '{name}' da classe '{class_name}': {e}")
+        self.n_params = len(self.param_names)
+        self.uses_super = has_base and "super(" in source
+        self._scope = None
+        self._fn = None
+
+    def function_for(self, module_vars):
+        """Função Python do método com globals encadeados ao escopo do módulo."""
+        if self._fn is None or self._scope is not module_vars:
+            if self.error:
+                raise self.error
+            env = syra_def.SyraNamespace({"str": str, "int": int, "float": float,
+                                          "__syra_missing__": cmpl.MISSING}, scope=module_vars)
+            self._fn = cmpl.make_function(self.code, env, self.defaults)
+            self._scope = module_vars
+        return self._fn
+
+    def invoke(self, self_obj, args, super_init=None, module_vars=_NO_MODULE):
+        fn = self.function_for(module_vars)
+        if len(args) > self.n_params:
+            args = args[:self.n_params]
+        if self.is_static:
+            return fn(*args)
+        return fn(super_init, self_obj, *args)
 
 def define_class(class_code):
     """
@@ -48,10 +350,15 @@ def define_class(class_code):
     class_name, base_class = m.groups()
     fields = []
     methods = {}
+    indexes = {}
     current_method = None
     method_lines = []
     for line in lines[1:]:
-        if re.match(r"(static\s+)?\w+\(.*\):", line.strip()):
+        index_match = INDEX_DECL_RE.match(line.strip())
+        if index_match and not current_method:
+            # Declaração de índice: `index campo` (ordenado) ou `index campo hash`
+            indexes[index_match.group(1)] = FieldIndex(index_match.group(1), index_match.group(2) or "sorted")
+        elif re.match(r"(static\s+)?\w+\(.*\):", line.strip()):
             # Salvando método anterior
             if current_method:
                 methods[current_method] = "\n".join(method_lines)
@@ -65,179 +372,332 @@ def define_class(class_code):
             fields.append(line.strip())
     if current_method:
         methods[current_method] = "\n".join(method_lines)
+    if class_name not in syra_classes:
+        class_definitions.append(class_name)
+    has_base = bool(base_class)
     syra_classes[class_name] = {
         "fields": fields,
-        "methods": methods,
+        "methods": methods,  # Código-fonte (usado por load_syra_module e pelos plugins)
+        "compiled": {name: SyraMethod(class_name, name, code, has_base) for name, code in methods.items()},
+        "indexes": indexes,
         "base": base_class
     }
+    # Redefinir uma classe muda a resolução dela e de todas as subclasses
+    _mro_cache.clear()
+    _method_tables.clear()
+    _layouts.clear()
+    _row_layouts.clear()
+    _reindex_live_objects(class_name)
     print(f"Classe '{class_name}' definida.")
 
+def _reindex_live_objects(class_name):
+    """
+    Objetos vivos da classe redefinida (e das subclasses) continuam com o layout
+    antigo, ligado aos índices antigos. O layout antigo passa a usar os índices
+    novos, que recebem os valores atuais desses objetos; assim o find os encontra.
+    """
+    pending = {}  # {layout antigo: [objetos]}
+    for live in list(syra_objects.values()):
+        if class_name in class_mro(live._syra_class):
+            pending.setdefault(type(live), []).append(live)
+    for old_layout, objs in pending.items():
+        indexed = object_layout(old_layout._syra_class)._indexed
+        old_layout._indexed = indexed
+        if indexed:
+            old_layout.__setattr__ = _indexed_setattr
+            old_layout.__del__ = _indexed_del
+        for field, indexes in indexed.items():
+            items = [(live._syra_id, getattr(live, field, None)) for live in objs]
+            for index in indexes:
+                index.load(items)
+
+def class_mro(class_name):
+    """Ordem de resolução de métodos: a classe e sua cadeia de bases definidas."""
+    mro = _mro_cache.get(class_name)
+    if mro is None:
+        chain = []
+        current = class_name
+        while current in syra_classes and current not in chain:
+            chain.append(current)
+            current = syra_classes[current]["base"]
+        mro = _mro_cache[class_name] = tuple(chain)
+    return mro
+
+def method_table(class_name):
+    """Tabela {método: SyraMethod} da classe, incluindo os herdados (cacheada)."""
+    table = _method_tables.get(class_name)
+    if table is None:
+        table = {}
+        for cls in reversed(class_mro(class_name)):
+            table.update(syra_classes[cls]["compiled"])
+        _method_tables[class_name] = table
+    return table
+
+def object_layout(class_name):
+    """Subclasse de SyraObject com slots para os campos da classe e de suas bases."""
+    layout = _layouts.get(class_name)
+    if layout is None:
+        fields = []
+        for cls in reversed(class_mro(class_name)):
+            for field in syra_classes[cls]["fields"]:
+                if field.isidentifier() and not field.startswith("_") and field not in fields:
+                    fields.append(field)
+        # _syra_id guarda o N de obj_N (SyraObject já aceita referências fracas)
+        attrs = {"__slots__": tuple(fields) + ("_syra_id",),
+                 "_syra_class": class_name, "_fields": tuple(fields)}
+        indexed = {}
+        for cls in class_mro(class_name):
+            for field, index in syra_classes[cls]["indexes"].items():
+                indexed.setdefault(field, []).append(index)
+        if indexed:
+            # Só classes com índices pagam pelo __setattr__ em Python
+            attrs.update({"_indexed": indexed, "__setattr__": _indexed_setattr, "__del__": _indexed_del})
+        layout = _layouts[class_name] = type(class_name, (SyraObject,), attrs)
+    return layout
+
 def instantiate(class_name, *args):
     global syra_object_counter
     if class_name not in syra_classes:
         print(f"Classe '{class_name}' não definida.")
         return None
     class_def = syra_classes[class_name]
-    obj_id = f"obj_{syra_object_counter}"
+    obj = object_layout(class_name)()
+    obj_id = syra_object_counter
     syra_object_counter += 1
-    obj = SyraObject({"__class__": class_name})
-    # Inicializa campos
+    # Inicializa campos (os herdados começam em None)
+    for field in obj._fields:
+        setattr(obj, field, None)
     for idx, field in enumerate(class_def["fields"]):
         obj[field] = args[idx] if idx < len(args) else None
     syra_objects[obj_id] = obj
+    # Com _syra_id definido, as escritas seguintes atualizam os índices
+    obj._syra_id = obj_id
+    for field, indexes in obj._indexed.items():
+        for index in indexes:
+            index.add(obj_id, getattr(obj, field, None))
     # Executa init se existir
-    if "init" in class_def["methods"]:
-        call_method(obj_id, "init", *args)
-    return obj_id
+    if "init" in method_table(class_name):
+        call_method(obj, "init", *args)
+    return obj
+
+# ===== Armazenamento colunar (instanciação em massa) =====
+
+def _typed_column(values):
+    """Coluna tipada: array('q') para inteiros, array('d') para números e lista para o resto."""
+    if values and all(type(v) is int for v in values):
+        try:
+            return array.array("q", values)
+        except OverflowError:
+            return values
+    if values and all(type(v) is int or type(v) is float for v in values):
+        return array.array("d", values)
+    return values
+
+def _row_field(field):
+    def get(self):
+        return self._store._columns[field][self._row]
+    def set(self, value):
+        self._store.set_value(field, self._row, value)
+    return property(get, set)
+
+def _row_init(self, store, row):
+    self._store = store
+    self._row = row
+
+def _row_repr(self):
+    return f"<{self._syra_class} linha {self._row}>"
+
+def row_layout(class_name):
+    """Subclasse de SyraObject cujos campos leem e escrevem nas colunas de um ColumnStore."""
+    layout = _row_layouts.get(class_name)
+    if layout is None:
+        fields = object_layout(class_name)._fields
+        attrs = {"__slots__": ("_store", "_row"), "__init__": _row_init, "__repr__": _row_repr, "__str__": _row_repr,
+                 "_syra_class": class_name, "_fields": fields}
+        for field in fields:
+            attrs[field] = _row_field(field)
+        layout = _row_layouts[class_name] = type(class_name, (SyraObject,), attrs)
+    return layout
+
+class ColumnStore:
+    """
+    Instâncias em massa de uma classe Syra no formato struct-of-arrays: uma
+    coluna tipada por campo declarado. Cada linha é uma visão (SyraObject)
+    que lê e escreve direto nas colunas; métodos da classe funcionam nela.
+    `$store.campo` retorna a coluna inteira, para varreduras e agregações.
+    Campos com `index` ganham um FieldIndex próprio, por número de linha,
+    e as linhas aparecem em find e nas contagens de &SyObjs.
+    """
+    def __init__(self, class_name, columns, size):
+        self.class_name = class_name
+        self._columns = columns  # {campo: array ou lista}
+        self._size = size
+        self._row_type = row_layout(class_name)
+        self._indexes = {}  # {campo: [FieldIndex]} com as linhas da store
+        for field, indexes in object_layout(class_name)._indexed.items():
+            if field in columns:
+                self._indexes[field] = [FieldIndex(field, index.kind) for index in indexes]
+                for index in self._indexes[field]:
+                    index.load(enumerate(columns[field]))
+        column_stores.add(self)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        row_type = self._row_type
+        for row in range(self._size):
+            yield row_type(self, row)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError(f"Linha {row} fora do intervalo (0..{self._size - 1})")
+        return self._row_type(self, row)
+
+    def __getattr__(self, name):
+        columns = self.__dict__.get("_columns")
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(f"'{self.__dict__.get('class_name')}' não tem o campo '{name}'")
+
+    def column(self, field):
+        return self._columns[field]
+
+    def find(self, conditions):
+        """Linhas (visões) que atendem a todas as condições [(campo, operador, valor)]."""
+        candidates = None
+        for field, op, value in conditions:
+            for index in self._indexes.get(field, ()):
+                found = index.lookup(op, value)
+                if found is not None and (candidates is None or len(found) < len(candidates)):
+                    candidates = found
+        rows = range(self._size) if candidates is None else sorted(candidates)
+        # Confere as condições direto nas colunas; só as linhas aceitas viram visões
+        for field, op, value in conditions:
+            column = self._columns.get(field)
+            if column is None:
+                return []
+            test = QUERY_OPS[op]
+            kept = []
+            for row in rows:
+                try:
+                    if test(column[row], value):
+                        kept.append(row)
+                except TypeError:
+                    pass
+            rows = kept
+        row_type = self._row_type
+        return [row_type(self, row) for row in rows]
+
+    def set_value(self, field, row, value):
+        for index in self._indexes.get(field, ()):
+            index.remove(row, self._columns[field][row])
+            index.add(row, value)
+        column = self._columns[field]
+        try:
+            column[row] = value
+        except (TypeError, OverflowError):
+            # Valor fora do tipo da coluna: a coluna passa a ser uma lista comum
+            column = self._columns[field] = list(column)
+            column[row] = value
+
+    def __repr__(self):
+        return f"<{self.class_name}: {self._size} instâncias em colunas {list(self._columns)}>"
+
+def bulk_instantiate(class_name, rows):
+    """
+    Cria instâncias em massa a partir de uma lista de tuplas (campos na ordem
+    declarada, bases primeiro), de dicionários ou de uma tabela Syra/DataFrame.
+    Os campos são preenchidos direto nas colunas; init não é executado.
+    """
+    if class_name not in syra_classes:
+        print(f"Classe '{class_name}' não definida.")
+        return None
+    fields = object_layout(class_name)._fields
+    rows = getattr(rows, "df", rows)  # Tabela Syra (&Syread(..., "table")): usa o DataFrame
+    if hasattr(rows, "columns") and hasattr(rows, "itertuples"):
+        # DataFrame: cada campo vem da coluna de mesmo nome, sem passar por linhas
+        size = len(rows)
+        columns = {f: rows[f].tolist() if f in rows.columns else [None] * size for f in fields}
+    else:
+        rows = list(rows)
+        size = len(rows)
+        if rows and isinstance(rows[0], dict):
+            columns = {f: [r.get(f) for r in rows] for f in fields}
+        else:
+            columns = {f: [r[i] if i < len(r) else None for r in rows] for i, f in enumerate(fields)}
+    return ColumnStore(class_name, {f: _typed_column(values) for f, values in columns.items()}, size)
+
+def live_objects(class_name=None, collect=False):
+    """
+    Contagem de objetos vivos por classe. Objetos presos só em ciclos saem
+    na próxima coleta do Python; collect=True força essa coleta antes de contar.
+    """
+    if collect:
+        gc.collect()
+    counts = {}
+    for live in list(syra_objects.values()):
+        counts[live._syra_class] = counts.get(live._syra_class, 0) + 1
+    for store in list(column_stores):
+        counts[store.class_name] = counts.get(store.class_name, 0) + len(store)
+    if class_name is not None:
+        return counts.get(class_name, 0)
+    return counts
+
+def _resolve(obj_id):
+    """Objeto Syra (o próprio handle) ou o objeto do identificador `obj_N`."""
+    if isinstance(obj_id, SyraObject):
+        return obj_id
+    if isinstance(obj_id, str) and obj_id.startswith("obj_") and obj_id[4:].isdigit():
+        return syra_objects.get(int(obj_id[4:]))
+    return None
 
 def call_method(obj_id, method_name, *args):
-    obj = syra_objects.get(obj_id)
+    obj = _resolve(obj_id)
     if not obj:
         print(f"Objeto '{obj_id}' não existe.")
         return
     class_name = obj["__class__"]
-    class_def = syra_classes[class_name]
-    method_code = None
-    if method_name in class_def["methods"]:
-        method_code = class_def["methods"][method_name]
-    elif class_def["base"]:
-        base = class_def["base"]
-        if base in syra_classes and method_name in syra_classes[base]["methods"]:
-            method_code = syra_classes[base]["methods"][method_name]
-    if not method_code:
+    method = method_table(class_name).get(method_name)
+    if method is None:
         print(f"Método '{method_name}' não existe na classe '{class_name}'.")
         return
+    return _run_method(obj_id, method, obj, args, class_modules.get(class_name, _NO_MODULE))
 
-    # Encontra de qual módulo a classe vem
-    module_vars = {}
-    for module_name, module_content in func.syra_modules.items():
-        if class_name in module_content:
-            module_vars = module_content
-            break
-
-    # Cria escopo local para self e args
-    local_vars = {"self": obj if isinstance(obj, SyraObject) else SyraObject(obj)}
-    header = method_code.splitlines()[0]
-    params = re.findall(r"\((.*?)\)", header)
-    param_names = [p.strip() for p in params[0].split(",")] if params and params[0].strip() else []
-    for idx, pname in enumerate(param_names):
-        if pname and idx < len(args):
-            local_vars[pname] = args[idx]
-    body = "\n".join(method_code.splitlines()[1:])
-    body_lines = body.splitlines()
-    new_body_lines = []
-    for line in body_lines:
-        stripped = line.strip()
-        m = re.match(r"super\((.*)\)", stripped)
-        if m and class_def["base"]:
-            # Avalia os argumentos de super()
-            super_args = [eval(arg.strip(), {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float}) for arg in m.group(1).split(",") if arg.strip()]
-            base_class = class_def["base"]
+def _run_method(obj_id, method, self_obj, args, module_vars):
+    """Executa o método já compilado (SyraMethod) sobre self_obj."""
+    super_init = None
+    if method.uses_super:
+        # super() sobe a partir da classe dona do método, não da classe do objeto
+        base = syra_classes[method.class_name]["base"]
+        def super_init(*super_args):
             # Chama o init da base
-            call_method_base(obj_id, class_def["base"], "init", *super_args)
-            continue  # Não executa a linha super no corpo
-        new_body_lines.append(line)
-    body = "\n".join(new_body_lines)
-    for line in body.splitlines():
-        exec_line = line.strip()
-        if exec_line.startswith("return "):
-            expr = exec_line[7:].strip()
-            # Adiciona module_vars ao escopo de avaliação
-            result = eval(expr, {**local_vars, **module_vars, "self": obj, "str": str, "int": int, "float": float})
-            return result
-        elif exec_line.startswith("shw("):
-            expr = exec_line[4:-1]
-            print(eval(expr, {**local_vars, **module_vars, "self": obj, "str": str, "int": int, "float": float}))
-        elif exec_line.startswith("print("):
-            expr = exec_line[6:-1]
-            print(eval(expr, {**local_vars, **module_vars, "self": obj, "str": str, "int": int, "float": float}))
-        elif "=" in exec_line:
-            left, right = exec_line.split("=", 1)
-            left = left.strip()
-            right = right.strip()
-            if left.startswith("self."):
-                setattr(local_vars["self"], left[5:], eval(right, {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float}))
-            else:
-                local_vars[left] = eval(right, {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float})
+            call_method_base(obj_id, base, "init", *super_args)
+    return method.invoke(self_obj, args, super_init, module_vars)
 
 def call_method_base(obj_id, base_class, method_name, *args):
-    obj = syra_objects.get(obj_id)
+    obj = _resolve(obj_id)
     if not obj:
         print(f"Objeto '{obj_id}' não existe.")
         return
-    class_def = syra_classes[base_class]
-    method_code = class_def["methods"].get(method_name)
-    if not method_code:
+    method = method_table(base_class).get(method_name) if base_class in syra_classes else None
+    if method is None:
         print(f"Método '{method_name}' não existe na classe base '{base_class}'.")
         return
-    local_vars = {"self": obj if isinstance(obj, SyraObject) else SyraObject(obj)}
-    header = method_code.splitlines()[0]
-    params = re.findall(r"\((.*?)\)", header)
-    param_names = [p.strip() for p in params[0].split(",")] if params and params[0].strip() else []
-    for idx, pname in enumerate(param_names):
-        if pname and idx < len(args):
-            local_vars[pname] = args[idx]
-    body = "\n".join(method_code.splitlines()[1:])
-    body_lines = body.splitlines()
-    new_body_lines = []
-    for line in body_lines:
-        stripped = line.strip()
-        m = re.match(r"super\((.*)\)", stripped)
-        if m and class_def["base"]:
-            super_args = [eval(arg.strip(), {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float}) for arg in m.group(1).split(",") if arg.strip()]
-            call_method_base(obj_id, class_def["base"], "init", *super_args)
-            continue
-        new_body_lines.append(line)
-    body = "\n".join(new_body_lines)
-    for line in body.splitlines():
-        exec_line = line.strip()
-        if exec_line.startswith("return "):
-            expr = exec_line[7:].strip()
-            result = eval(expr, {**local_vars, "str": str, "int": int, "float": float})
-            return result
-        elif exec_line.startswith("shw(") or exec_line.startswith("print("):
-            expr = exec_line[exec_line.find("(")+1:-1]
-            print(eval(expr, {**local_vars, "str": str, "int": int, "float": float}))
-        elif "=" in exec_line:
-            left, right = exec_line.split("=", 1)
-            left = left.strip()
-            right = right.strip()
-            if left.startswith("self."):
-                setattr(local_vars["self"], left[5:], eval(right, {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float}))
-            else:
-                local_vars[left] = eval(right, {"self": local_vars["self"], **local_vars, "str": str, "int": int, "float": float})
+    return _run_method(obj_id, method, obj, args, _NO_MODULE)
 
 def static_call(class_name, method_name, *args):
     if class_name not in syra_classes:
         print(f"Classe '{class_name}' não definida.")
         return
-    class_def = syra_classes[class_name]
-    if method_name not in class_def["methods"]:
+    method = method_table(class_name).get(method_name)
+    if method is None:
         print(f"Método estático '{method_name}' não existe na classe '{class_name}'.")
         return
-    method_code = class_def["methods"][method_name]
-    header = method_code.splitlines()[0]
-    params = re.findall(r"\((.*?)\)", header)
-    param_names = [p.strip() for p in params[0].split(",")] if params and params[0].strip() else []
-    local_vars = {}
-    for idx, pname in enumerate(param_names):
-        if pname and idx < len(args):
-            local_vars[pname] = args[idx]
-    body = "\n".join(method_code.splitlines()[1:])
-    for line in body.splitlines():
-        exec_line = line.strip()
-        if exec_line.startswith("return "):
-            expr = exec_line[7:].strip()
-            result = eval(expr, {**local_vars, "str": str, "int": int, "float": float})
-            return result
-        elif exec_line.startswith("shw(") or exec_line.startswith("print("):
-            expr = exec_line[exec_line.find("(")+1:-1]
-            print(eval(expr, {**local_vars, "str": str, "int": int, "float": float}))
-        elif "=" in exec_line:
-            left, right = exec_line.split("=", 1)
-            local_vars[left.strip()] = eval(right.strip(), {**local_vars, "str": str, "int": int, "float": float})
     # Se não houver return explícito, retorna None
-    return None
+    return method.invoke(None, args)
 
 # Exemplo de uso (para testes):
 if __name__ == "__main__":
@@ -0,0 +1,278 @@
+import hashlib
+import os
+import pickle
+import re
+
+# Lexer e parser de arquivos .syra.
+# Transforma o código-fonte inteiro em uma lista de nós (AST) em uma única
+# passada, usando a indentação para delimitar os blocos. Cada linha é
+# analisada uma vez por execução; o interpretador (func.py) executa os nós.
+# A AST de cada arquivo fica guardada em __syracache__/<nome>.syrac, ao lado
+# do fonte (como o __pycache__ do Python), e é reaproveitada nas próximas
+# execuções enquanto o fonte não mudar.
+
+FUNC_HEADER_RE = re.compile(r"^\w+\s*\(.*\)\s+is(\s|:|->)")
+CLASS_HEADER_RE = re.compile(r"^class\s+(\w+)")
+MATCH_HEADER_RE = re.compile(r"^(\$?\w+)\s*=\s*match\s+([^\:]+)\s*:", re.IGNORECASE)
+EACH_HEADER_RE = re.compile(r"^each\s+(\([^)]+\)|\$\w+)\s+in\s+(.+?)\s*:$")
+RESCUE_HEADER_RE = re.compile(r"^&rescue(?:\s+(\w+))?\s*:", re.IGNORECASE)
+
+SYRAC_MAGIC = "syrac-2"  # Mude ao alterar os nós da AST: invalida os .syrac antigos
+CACHE_DIR = "__syracache__"
+cache_enabled = not os.environ.get("SYRA_NO_CACHE")  # SYRA_NO_CACHE=1 desliga o .syrac
+
+class SyraLine:
+    """Linha lógica produzida pelo lexer (sem comentários e sem linhas vazias)."""
+    __slots__ = ("lineno", "indent", "code", "text")
+
+    def __init__(self, lineno, indent, code, text):
+        self.lineno = lineno  # Número da linha no arquivo (1-based)
+        self.indent = indent  # Largura da indentação (tabs = 4 espaços)
+        self.code = code      # Linha com a indentação original, sem comentário
+        self.text = text      # Linha sem indentação e sem comentário
+
+    def __repr__(self):
+        return f"<SyraLine {self.lineno}:{self.indent} {self.text!r}>"
+
+# ===== Nós da AST =====
+
+class SyraNode:
+    """Nó base da AST Syra."""
+    def __init__(self, lineno):
+        self.lineno = lineno
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} linha {self.lineno}>"
+
+    def __getstate__(self):
+        # Atributos "_" são caches de execução (ex: EachBlock._steps): não vão para o .syrac
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
+class Stmt(SyraNode):
+    """Instrução simples de uma linha (comando, atribuição, chamada...)."""
+    def __init__(self, lineno, text):
+        super().__init__(lineno)
+        self.text = text
+
+    def __repr__(self):
+        return f"<Stmt linha {self.lineno}: {self.text!r}>"
+
+class FuncDef(SyraNode):
+    """Definição de função Syra, com decoradores e corpo."""
+    def __init__(self, lineno, name, decorators, source):
+        super().__init__(lineno)
+        self.name = name
+        self.decorators = decorators
+        self.source = source
+
+class ClassDef(SyraNode):
+    """Definição de classe Syra (campos e métodos)."""
+    def __init__(self, lineno, name, source):
+        super().__init__(lineno)
+        self.name = name
+        self.source = source
+
+class MatchBlock(SyraNode):
+    """Bloco `var = match expr:` com suas linhas `case`."""
+    def __init__(self, lineno, source):
+        super().__init__(lineno)
+        self.source = source
+
+class EachBlock(SyraNode):
+    """Laço `each $item in iteravel:` com o corpo já analisado."""
+    def __init__(self, lineno, var_part, iterable_expr, body):
+        super().__init__(lineno)
+        self.var_part = var_part
+        self.iterable_expr = iterable_expr
+        self.body = body
+
+class AttemptBlock(SyraNode):
+    """Bloco `&attempt:` / `&rescue e:`."""
+    def __init__(self, lineno, body, rescue_var, rescue_body):
+        super().__init__(lineno)
+        self.body = body
+        self.rescue_var = rescue_var
+        self.rescue_body = rescue_body
+
+# ===== Lexer =====
+
+def strip_comment(line):
+    """Remove o comentário `//` da linha, ignorando `//` dentro de strings."""
+    if "//" not in line:
+        return line
+    quote = None
+    i = 0
+    n = len(line)
+    while i < n:
+        ch = line[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == "/" and i + 1 < n and line[i + 1] == "/":
+            return line[:i]
+        i += 1
+    return line
+
+def tokenize(source):
+    """Divide o código-fonte em linhas lógicas (SyraLine)."""
+    lines = []
+    for lineno, raw in enumerate(source.splitlines(), 1):
+        code = strip_comment(raw).rstrip()
+        text = code.lstrip()
+        if not text:
+            continue
+        indent = len(code[:len(code) - len(text)].expandtabs(4))
+        lines.append(SyraLine(lineno, indent, code, text))
+    return lines
+
+# ===== Parser =====
+
+def _block_end(lines, pos, indent):
+    """Retorna o índice da primeira linha após o bloco indentado iniciado em pos."""
+    n = len(lines)
+    while pos < n and lines[pos].indent > indent:
+        pos += 1
+    return pos
+
+def _source_of(lines, start, end):
+    return "\n".join(l.code for l in lines[start:end])
+
+def _parse_funcdef(lines, pos):
+    start = pos
+    decorators = []
+    while pos < len(lines) and lines[pos].text.startswith("@"):
+        decorators.append(lines[pos].text[1:].strip())
+        pos += 1
+    if pos >= len(lines) or not FUNC_HEADER_RE.match(lines[pos].text):
+        line = lines[min(pos, len(lines) - 1)]
+        raise SyntaxError(f"Linha {line.lineno}: esperada definição de função após decorador(es).")
+    header = lines[pos]
+    name = header.text.split("(", 1)[0].strip()
+    end = _block_end(lines, pos + 1, header.indent) if header.text.endswith(":") else pos + 1
+    return FuncDef(lines[start].lineno, name, decorators, _source_of(lines, start, end)), end
+
+def _parse_attempt(lines, pos):
+    header = lines[pos]
+    body, pos = parse_block(lines, pos + 1, header.indent)
+    rescue_var = "e"
+    rescue_body = []
+    if pos < len(lines) and lines[pos].indent == header.indent and lines[pos].text.lower().startswith("&rescue"):
+        m = RESCUE_HEADER_RE.match(lines[pos].text)
+        if m and m.group(1):
+            rescue_var = m.group(1)
+        rescue_body, pos = parse_block(lines, pos + 1, header.indent)
+    return AttemptBlock(header.lineno, body, rescue_var, rescue_body), pos
+
+def parse_block(lines, pos, parent_indent):
+    """Analisa as linhas mais indentadas que parent_indent a partir de pos."""
+    nodes = []
+    n = len(lines)
+    while pos < n and lines[pos].indent > parent_indent:
+        line = lines[pos]
+        text = line.text
+        if text.startswith("@") or FUNC_HEADER_RE.match(text):
+            node, pos = _parse_funcdef(lines, pos)
+        elif text.startswith("class "):
+            end = _block_end(lines, pos + 1, line.indent)
+            m = CLASS_HEADER_RE.match(text)
+            node = ClassDef(line.lineno, m.group(1) if m else None, _source_of(lines, pos, end))
+            pos = end
+        elif text.lower().startswith("&attempt:"):
+            node, pos = _parse_attempt(lines, pos)
+        elif text.startswith("each ") and EACH_HEADER_RE.match(text):
+            m = EACH_HEADER_RE.match(text)
+            body, pos = parse_block(lines, pos + 1, line.indent)
+            node = EachBlock(line.lineno, m.group(1), m.group(2).strip(), body)
+        elif " match " in text and MATCH_HEADER_RE.match(text):
+            end = _block_end(lines, pos + 1, line.indent)
+            node = MatchBlock(line.lineno, _source_of(lines, pos, end))
+            pos = end
+        else:
+            node = Stmt(line.lineno, text)
+            pos += 1
+        nodes.append(node)
+    return nodes, pos
+
+def parse(source):
+    """Analisa o código-fonte Syra completo e retorna a lista de nós da AST."""
+    lines = tokenize(source)
+    nodes, pos = parse_block(lines, 0, -1)
+    return nodes
+
+# ===== Cache em disco (.syrac) =====
+
+def cache_path(filename):
+    """Caminho do .syrac de um arquivo: <pasta>/__syracache__/<nome>.syrac"""
+    folder, base = os.path.split(os.path.abspath(filename))
+    return os.path.join(folder, CACHE_DIR, os.path.splitext(base)[0] + ".syrac")
+
+def _source_digest(source):
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def _write_cache(path, header, nodes):
+    """Grava o .syrac de forma atômica; falhas (pasta sem escrita etc.) são ignoradas."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    payload = pickle.dumps(nodes, protocol=pickle.HIGHEST_PROTOCOL)
+    # O hash dos nós detecta um .syrac corrompido que ainda seria um pickle válido
+    header = {**header, "payload": hashlib.sha256(payload).hexdigest()}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def _load_nodes(f, header):
+    """Lê os nós gravados após o cabeçalho, conferindo o hash antes de desserializar."""
+    payload = f.read()
+    if hashlib.sha256(payload).hexdigest() != header.get("payload"):
+        raise ValueError("nós do .syrac corrompidos")
+    return pickle.loads(payload)
+
+def parse_file(filename):
+    """
+    Lê e analisa um arquivo .syra, usando o .syrac quando ele é válido.
+    O .syrac vale se mtime e tamanho do fonte batem; se só o mtime mudou
+    (ex: checkout ou `touch`), o hash do conteúdo decide e o cabeçalho é
+    atualizado sem reanalisar o arquivo.
+    """
+    if not cache_enabled:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return parse(f.read())
+    st = os.stat(filename)
+    path = cache_path(filename)
+    source = None
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("magic") == SYRAC_MAGIC:
+                if header.get("mtime") == st.st_mtime_ns and header.get("size") == st.st_size:
+                    return _load_nodes(f, header)
+                with open(filename, 'r', encoding='utf-8') as src:
+                    source = src.read()
+                if header.get("hash") == _source_digest(source):
+                    nodes = _load_nodes(f, header)
+                    header.update(mtime=st.st_mtime_ns, size=st.st_size)
+                    _write_cache(path, header, nodes)
+                    return nodes
+    except Exception:
+        # .syrac ausente, corrompido ou de outra versão (pickle.load pode levantar
+        # quase qualquer exceção com bytes inválidos): analisa de novo
+        pass
+    if source is None:
+        with open(filename, 'r', encoding='utf-8') as f:
+            source = f.read()
+    nodes = parse(source)
+    header = {"magic": SYRAC_MAGIC, "mtime": st.st_mtime_ns, "size": st.st_size, "hash": _source_digest(source)}
+    _write_cache(path, header, nodes)
+    return nodes
@@ -1,6 +1,31 @@
-import func # Importa func.py, que deve popular func.commands e gerenciar func.variables
+import importlib
 import os
 import sys
+import time
+
+# Módulos do interpretador, das dependências para quem as usa (func importa obj)
+STARTUP_MODULES = ("prs", "dsp", "cmpl", "deff", "tps", "imp", "func")
+HEAVY_MODULES = ("pandas", "numpy", "cv2")  # Devem ser carregados só quando usados
+
+func = None  # func.py, que popula func.commands e gerencia func.variables
+
+def load_interpreter(profile=False):
+    """Importa os módulos do interpretador; com profile=True imprime o tempo de cada um."""
+    global func
+    timings = []
+    for name in STARTUP_MODULES:
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        importlib.import_module(name)
+        timings.append((name, time.perf_counter() - start, len(sys.modules) - loaded))
+    func = sys.modules["func"]
+    if profile:
+        print("[Syra startup] tempo de importação por módulo:", file=sys.stderr)
+        for name, elapsed, new_modules in timings:
+            print(f"  {name:<6} {elapsed * 1000:8.2f} ms  (+{new_modules} módulos)", file=sys.stderr)
+        print(f"  total  {sum(t for _, t, _ in timings) * 1000:8.2f} ms", file=sys.stderr)
+        heavy = [m for m in HEAVY_MODULES if m in sys.modules]
+        print(f"  pesados carregados: {', '.join(heavy) if heavy else 'nenhum'}", file=sys.stderr)
 
 def repl():
     print("Syra REPL - Digite comandos Syra. Ctrl+C para sair.")
@@ -27,11 +52,19 @@ def repl():
             break
 
 if __name__ == "__main__":
-    if len(sys.argv) == 2:
-        file_to_run = sys.argv[1]
+    args = sys.argv[1:]
+    profile = "--startup-profile" in args
+    if profile:
+        args.remove("--startup-profile")
+    load_interpreter(profile)
+    if len(args) == 1:
+        file_to_run = args[0]
         if not os.path.exists(file_to_run):
             print(f"Erro: Arquivo '{file_to_run}' não encontrado.")
             sys.exit(1)
+        start = time.perf_counter()
         func.run_syra_file(file_to_run)
+        if profile:
+            print(f"[Syra startup] execução de '{file_to_run}': {(time.perf_counter() - start) * 1000:.2f} ms", file=sys.stderr)
     else:
         repl()
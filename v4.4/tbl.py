@@ -0,0 +1,137 @@
+import operator
+
+# Tabelas Syra.
+# SyraTable embrulha um DataFrame do pandas sem copiá-lo: as colunas
+# continuam tipadas, o each percorre as linhas como dicionários e o texto
+# da tabela só é gerado quando ela é exibida (shw/print).
+# As operações (filter, group_by, sort, join) rodam vetorizadas no pandas
+# e retornam uma nova tabela; nenhuma percorre as linhas em Python.
+
+ROW_BATCH = 10000  # Linhas convertidas por vez ao percorrer a tabela no each
+
+# Nomes de tipo Syra aceitos nas dicas de dtype de &Syread(..., "table")
+SYRA_DTYPES = {
+    "int": "Int64",  # Inteiro que aceita valores ausentes
+    "float": "float64",
+    "str": "string",
+    "bool": "boolean",
+}
+
+FILTER_OPS = {
+    "==": operator.eq, "!=": operator.ne,
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+}
+AGGREGATES = ("sum", "mean", "count", "min", "max")
+JOIN_TYPES = ("inner", "left")
+
+class SyraTableError(Exception):
+    """Erro em uma operação de tabela Syra (coluna, operador ou agregação inválidos)."""
+    pass
+
+def _column_list(columns):
+    return [columns] if isinstance(columns, str) else list(columns)
+
+def pandas_dtypes(dtype):
+    """Traduz {coluna: tipo Syra ou do pandas} para os dtypes do pandas."""
+    if not dtype:
+        return None
+    return {column: SYRA_DTYPES.get(kind, kind) for column, kind in dtype.items()}
+
+class SyraTable:
+    """Tabela Syra sobre um DataFrame (sem cópia)."""
+
+    def __init__(self, df):
+        self.df = df
+
+    @property
+    def columns(self):
+        return list(self.df.columns)
+
+    @property
+    def dtypes(self):
+        return {column: str(kind) for column, kind in self.df.dtypes.items()}
+
+    def __len__(self):
+        return len(self.df)
+
+    def __iter__(self):
+        # Uma linha por vez, como dicionário {coluna: valor} com valores Python;
+        # a conversão é feita em lotes de ROW_BATCH linhas, não na tabela toda
+        df = self.df
+        for start in range(0, len(df), ROW_BATCH):
+            yield from df.iloc[start:start + ROW_BATCH].to_dict("records")
+
+    def __getitem__(self, key):
+        """$tabela["coluna"] retorna a coluna; $tabela[i] retorna a linha i."""
+        if isinstance(key, int):
+            return self.df.iloc[[key]].to_dict("records")[0]
+        return self.df[key]
+
+    def _check_columns(self, columns):
+        missing = [c for c in columns if c not in self.df.columns]
+        if missing:
+            raise SyraTableError(f"Coluna(s) inexistente(s): {missing}. Colunas: {self.columns}")
+
+    # ===== Operações vetorizadas =====
+
+    def filter(self, column, op, value):
+        """
+        Linhas em que `coluna op valor` é verdadeiro.
+        op: ==, !=, >, >=, <, <= ou "in" (valor é uma lista).
+        Ex: $t.filter("idade", ">", 30)
+        """
+        self._check_columns([column])
+        series = self.df[column]
+        if op == "in":
+            mask = series.isin(list(value))
+        elif op in FILTER_OPS:
+            mask = FILTER_OPS[op](series, value)
+        else:
+            raise SyraTableError(f"Operador de filtro inválido: '{op}'. Use: {', '.join(FILTER_OPS)}, in")
+        return SyraTable(self.df[mask])
+
+    def group_by(self, by, columns=None, func="sum"):
+        """
+        Agrupa pelas colunas `by` e agrega `columns` com func (sum, mean, count, min, max).
+        columns também pode ser {coluna: func}. Sem columns, conta as linhas de cada grupo.
+        Ex: $t.group_by("cidade", "valor", "sum") ou $t.group_by("cidade", {"valor": "mean"})
+        """
+        by = _column_list(by)
+        self._check_columns(by)
+        grouped = self.df.groupby(by, sort=True, dropna=False)
+        if columns is None:
+            return SyraTable(grouped.size().reset_index(name="count"))
+        spec = dict(columns) if isinstance(columns, dict) else {c: func for c in _column_list(columns)}
+        self._check_columns(list(spec))
+        invalid = [f for f in spec.values() if f not in AGGREGATES]
+        if invalid:
+            raise SyraTableError(f"Agregação inválida: {invalid}. Use: {', '.join(AGGREGATES)}")
+        return SyraTable(grouped.agg(spec).reset_index())
+
+    def sort(self, columns, desc=False):
+        """Ordena pelas colunas (estável). Ex: $t.sort("idade", desc=True)"""
+        columns = _column_list(columns)
+        self._check_columns(columns)
+        return SyraTable(self.df.sort_values(columns, ascending=not desc, kind="stable").reset_index(drop=True))
+
+    def join(self, other, on, how="inner"):
+        """
+        Junta com outra tabela pelas colunas `on` (how: inner ou left).
+        Ex: $pedidos.join($clientes, "cliente_id", how="left")
+        """
+        if how not in JOIN_TYPES:
+            raise SyraTableError(f"Tipo de junção inválido: '{how}'. Use: {', '.join(JOIN_TYPES)}")
+        on = _column_list(on)
+        other_df = other.df if isinstance(other, SyraTable) else other
+        self._check_columns(on)
+        missing = [c for c in on if c not in other_df.columns]
+        if missing:
+            raise SyraTableError(f"Coluna(s) de junção ausente(s) na outra tabela: {missing}")
+        return SyraTable(self.df.merge(other_df, on=on, how=how))
+
+    def __str__(self):
+        return self.df.to_string()
+
+    def __repr__(self):
+        return f"<tabela Syra: {len(self.df)} linhas x {len(self.df.columns)} colunas>"
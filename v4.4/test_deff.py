@@ -0,0 +1,35 @@
+import contextlib
+import io
+import unittest
+
+import func
+import deff as syra_def
+
+# Testes do decorador nativo @memo. Rodar com: python -m unittest test_deff
+
+class MemoInvalidationTest(unittest.TestCase):
+    def run_syra(self, code):
+        with contextlib.redirect_stdout(io.StringIO()):
+            func.run_syra_code(code)
+
+    def stats(self, name):
+        return syra_def.memo_functions[name].cache_info()
+
+    def test_definicao_sem_relacao_mantem_cache(self):
+        self.run_syra("@memo\nquadrado_m(n) is n * n")
+        self.run_syra("quadrado_m(4)")
+        self.run_syra("sem_relacao_m(x) is x + 1")
+        self.run_syra("quadrado_m(4)")
+        self.assertEqual(self.stats("quadrado_m")["hits"], 1)
+        self.assertEqual(self.stats("quadrado_m")["size"], 1)
+
+    def test_redefinir_dependencia_descarta_cache(self):
+        self.run_syra("base_m(x) is x * 2")
+        self.run_syra("@memo\nusa_base_m(n) is base_m(n) + 1")
+        self.assertEqual(syra_def.syra_functions["usa_base_m"](3), 7)
+        self.run_syra("base_m(x) is x * 3")
+        self.assertEqual(syra_def.syra_functions["usa_base_m"](3), 10)
+        self.assertEqual(self.stats("usa_base_m")["misses"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
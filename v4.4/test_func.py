@@ -0,0 +1,31 @@
+import contextlib
+import io
+import unittest
+
+import func
+
+# Testes da avaliação de expressões Syra (func._compile_expr).
+# Rodar com: python -m unittest test_func
+
+class StringLiteralTest(unittest.TestCase):
+    def run_syra(self, code):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            func.run_syra_code(code)
+        return out.getvalue()
+
+    def test_variavel_dentro_de_string_fica_literal(self):
+        output = self.run_syra('$n = 5\nshw("total: $n")\n')
+        self.assertEqual(output.strip(), "total: $n")
+
+    def test_variavel_fora_de_string_e_avaliada(self):
+        self.run_syra('$n = 5\n$msg = "total: $n " + str($n) + \'$n\'\n')
+        self.assertEqual(func.variables["$msg"], "total: $n 5$n")
+
+    def test_variavel_inexistente_dentro_de_string(self):
+        func.variables.pop("$inexistente", None)
+        self.run_syra('$msg = "custa $inexistente"\n')
+        self.assertEqual(func.variables["$msg"], "custa $inexistente")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import contextlib
+import io
+import unittest
+
+import func
+import obj
+
+# Testes dos objetos Syra (obj.py). Rodar com: python -m unittest test_obj
+
+CLASSE = (
+    "class Pessoa:\n"
+    "    nome\n"
+    "    idade\n"
+    "    index idade\n"
+    "{extra}"
+    "    set_nome(n):\n"
+    "        self.nome = n\n"
+)
+
+class RedefinedClassIndexTest(unittest.TestCase):
+    def run_syra(self, code):
+        with contextlib.redirect_stdout(io.StringIO()):
+            func.run_syra_code(code)
+
+    def test_find_apos_redefinir_classe(self):
+        self.run_syra(CLASSE.format(extra="") + '$a = Pessoa("ana", 30)\n$b = Pessoa("bia", 40)\n')
+        # Redefinição com um índice novo: os objetos vivos entram nos índices novos
+        self.run_syra(CLASSE.format(extra="    index nome hash\n"))
+        a, b = func.variables["$a"], func.variables["$b"]
+        self.assertEqual(obj.find_objects("Pessoa", [("idade", "==", 30)]), [a])
+        self.assertEqual(obj.find_objects("Pessoa", [("nome", "==", "bia")]), [b])
+        # Escritas nos objetos antigos atualizam os índices novos
+        self.run_syra('$b.set_nome("beto")\n')
+        self.assertEqual(obj.find_objects("Pessoa", [("nome", "==", "beto")]), [b])
+        self.assertEqual(obj.find_objects("Pessoa", [("nome", "==", "bia")]), [])
+
+if __name__ == "__main__":
+    unittest.main()
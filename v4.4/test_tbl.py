@@ -0,0 +1,78 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import func
+
+# Testes das tabelas Syra (&Syread(..., "table")), executando código Syra
+# como um script faria. Rodar com: python -m unittest test_tbl
+
+VENDAS = "id,cidade,valor\n1,Recife,10\n2,Olinda,5\n3,Recife,-2\n4,Natal,7\n"
+CIDADES = "cidade,uf\nRecife,PE\nOlinda,PE\n"
+
+class DocumentedExampleTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        for name, content in (("vendas.csv", VENDAS), ("cidades.csv", CIDADES)):
+            with open(name, "w", encoding="utf-8") as f:
+                f.write(content)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def run_syra(self, code):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            func.run_syra_code(code)
+        return out.getvalue()
+
+    def test_operacoes_em_tabelas(self):
+        # Exemplo da seção "Operações em tabelas" do red.md
+        output = self.run_syra(
+            '$vendas = &Syread("vendas.csv", "table")\n'
+            '$por_cidade = $vendas.filter("valor", ">", 0).group_by("cidade", {"valor": "sum", "id": "count"})\n'
+            'shw($por_cidade.sort("valor", desc=True))\n'
+            'shw($vendas.join(&Syread("cidades.csv", "table"), "cidade", how="left"))\n'
+        )
+        por_cidade = func.variables["$por_cidade"]
+        self.assertEqual(list(por_cidade.sort("valor", desc=True)["cidade"]), ["Recife", "Natal", "Olinda"])
+        self.assertIn("uf", output)
+        self.assertIn("PE", output)
+
+    def test_comando_aninhado_em_expressao(self):
+        func.run_syra_code('$colunas = &Syread("cidades.csv", "table").columns')
+        self.assertEqual(func.variables["$colunas"], ["cidade", "uf"])
+        func.run_syra_code('$n = len(&Syread("vendas.csv", "table")) + 1')
+        self.assertEqual(func.variables["$n"], 5)
+
+    def test_erro_na_leitura_em_blocos(self):
+        # usecols inválido e arquivo inexistente são capturados pelo &attempt
+        for call in ('&Syread("vendas.csv", "table", 2, usecols=["nao_existe"])',
+                     '&Syread("sem_arquivo.csv", "table", 2)'):
+            func.variables.pop("$e", None)
+            self.run_syra(
+                '&attempt:\n'
+                f'    each $bloco in {call}:\n'
+                '        shw($bloco)\n'
+                '&rescue e:\n'
+                '    shw("Erro: " + $e)\n'
+            )
+            self.assertIn("$e", func.variables)
+
+    def test_dtype_invalido_na_leitura_em_blocos(self):
+        output = self.run_syra(
+            '&attempt:\n'
+            '    each $bloco in &Syread("vendas.csv", "table", 2, dtype={"cidade": "int"}):\n'
+            '        shw($bloco)\n'
+            '&rescue e:\n'
+            '    shw("Erro: " + $e)\n'
+        )
+        self.assertIn("Erro ao ler tabela 'vendas.csv'", output)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,25 @@
+import ast
+import atexit
+import functools
+import itertools
 import os
 import subprocess
 import re
 import json
 import glob
 from decimal import Decimal, getcontext
-import pandas as pd
 import csv
 import io
+from contextlib import contextmanager
 
 # Dicionário global para armazenar os tipos das variáveis
 variable_types = {}
 open_files = {}  # Rastreia arquivos abertos: {nome: objeto_arquivo}
+DEFAULT_CHUNK_SIZE = 64 * 1024  # Caracteres por bloco em &Syread(arquivo, "chunks")
+DEFAULT_WRITE_BUFFER = 1024 * 1024  # Buffer de &Syope(nome, ext, True)
+WRITE_BATCH = 10000  # Itens por write() no Sywr em massa
+buffered_files = {}  # Arquivos abertos em modo buffer: {nome: já tem conteúdo?}
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')  # JSON Lines: um registro JSON por linha
 
 # Lista de tipos suportados com seus validadores
 SYRA_TYPES = {
@@ -152,8 +161,13 @@ def SyraOS(command, show_output=False):
         print(msg)
         return msg
 
-def Syope(filename, extension=None):
-    """Abre ou cria um arquivo. Retorna o nome do arquivo para operações futuras."""
+def Syope(filename, extension=None, buffer=None):
+    """
+    Abre ou cria um arquivo. Retorna o nome do arquivo para operações futuras.
+    Com buffer (tamanho em bytes, ou True para DEFAULT_WRITE_BUFFER) o arquivo
+    fica em modo buffer: Sywr só escreve no disco quando o buffer enche, no
+    Sycls ou ao fim do programa, em vez de um flush por linha.
+    """
     if extension and not filename.endswith(extension):
         full_filename = f"{filename}{extension}"
     else:
@@ -163,35 +177,83 @@ def Syope(filename, extension=None):
         # Fechar o arquivo se já estiver aberto
         if full_filename in open_files:
             open_files[full_filename].close()
+            buffered_files.pop(full_filename, None)
         
         # Abrir para leitura e escrita (criando se não existir)
-        file = open(full_filename, 'a+')
+        if buffer:
+            buffer_size = DEFAULT_WRITE_BUFFER if buffer is True else int(buffer)
+            file = open(full_filename, 'a+', buffering=buffer_size)
+            # O tamanho é consultado só aqui; depois o estado fica em buffered_files
+            buffered_files[full_filename] = file.seek(0, os.SEEK_END) > 0
+        else:
+            file = open(full_filename, 'a+')
         file.seek(0)  # Posicionar no início para leitura
         open_files[full_filename] = file
         return full_filename
     except Exception as e:
         return f"[ERRO AO ABRIR] {str(e)}"
 
+def _is_bulk(content):
+    """Listas, tuplas, ranges e geradores são escritos uma linha por item."""
+    return hasattr(content, '__iter__') and not isinstance(content, (str, bytes, dict))
+
+def _jsonl_record(value):
+    """Um registro JSON Lines: o valor em JSON, numa única linha."""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+def _write_bulk(file, content, has_content, serialize=str):
+    """Escreve os itens em lotes de WRITE_BATCH linhas; retorna quantas linhas escreveu."""
+    items = iter(content)
+    count = 0
+    while True:
+        batch = [serialize(item) for item in itertools.islice(items, WRITE_BATCH)]
+        if not batch:
+            return count
+        file.write(("\n" if has_content or count else "") + "\n".join(batch))
+        count += len(batch)
+
 def Sywr(filename, content):
-    """Escreve conteúdo em um arquivo, em uma nova linha."""
+    """
+    Escreve conteúdo em um arquivo, em uma nova linha.
+    Se content for uma lista ou outro iterável, escreve um item por linha de uma vez.
+    Em arquivos .jsonl/.ndjson cada item (ou o próprio content) vira um registro JSON.
+    """
     if filename not in open_files:
         return f"[ERRO] Arquivo '{filename}' não está aberto. Use Syope() primeiro."
     
     try:
         file = open_files[filename]
-        # Verificar se o arquivo está vazio ou se já tem conteúdo
-        file.seek(0, os.SEEK_END)
-        file_size = file.tell()
+        if filename in buffered_files:
+            # Modo buffer: sem seek/tell/flush por chamada
+            has_content = buffered_files[filename]
+            file_size = None
+        else:
+            # Verificar se o arquivo está vazio ou se já tem conteúdo
+            file.seek(0, os.SEEK_END)
+            file_size = file.tell()
+            has_content = file_size > 0
         
-        if file_size > 0:
-            # Se o arquivo não estiver vazio, adiciona uma nova linha
-            file.write(f"\n{content}")
+        serialize = _jsonl_record if filename.endswith(JSONL_EXTENSIONS) else str
+        if _is_bulk(content):
+            count = _write_bulk(file, content, has_content, serialize)
+            message = f"{count} linhas escritas em '{filename}'"
+            has_content = has_content or count > 0
         else:
-            # Se estiver vazio, apenas escreve o conteúdo
-            file.write(f"{content}")
+            content = serialize(content)
+            if has_content:
+                # Se o arquivo não estiver vazio, adiciona uma nova linha
+                file.write(f"\n{content}")
+            else:
+                # Se estiver vazio, apenas escreve o conteúdo
+                file.write(f"{content}")
+            has_content = True
+            message = f"Conteúdo escrito em '{filename}'"
         
-        file.flush()  # Garantir que o conteúdo seja escrito imediatamente
-        return f"Conteúdo escrito em '{filename}'"
+        if file_size is None:
+            buffered_files[filename] = has_content
+        else:
+            file.flush()  # Garantir que o conteúdo seja escrito imediatamente
+        return message
     except Exception as e:
         return f"[ERRO AO ESCREVER] {str(e)}"
 
@@ -199,16 +261,35 @@ def Sycls(filename):
     """Fecha um arquivo aberto."""
     if filename in open_files:
         try:
-            open_files[filename].close()
+            open_files[filename].close()  # Também descarrega o buffer
             del open_files[filename]
+            buffered_files.pop(filename, None)
             return f"Arquivo '{filename}' fechado com sucesso"
         except Exception as e:
             return f"[ERRO AO FECHAR] {str(e)}"
     else:
         return f"[AVISO] Arquivo '{filename}' não estava aberto"
 
-def Syread(filename):
-    """Lê e exibe o conteúdo de um arquivo."""
+def Syread(filename, mode=None, size=None, usecols=None, dtype=None):
+    """
+    Lê e exibe o conteúdo de um arquivo.
+    Com mode ("lines", "chunks", "rows" ou "records") retorna um leitor
+    preguiçoso para o each, que lê o arquivo aos poucos (memória constante).
+    Arquivos .jsonl/.ndjson são sempre lidos assim, como registros ("records").
+    Com mode "table" retorna uma tabela Syra (tbl.SyraTable) de um CSV/TSV ou
+    Excel, lendo só as colunas de usecols e com os tipos de dtype. Com size,
+    um CSV/TSV é lido em blocos de `size` linhas: o each recebe uma tabela por
+    bloco e a memória fica limitada ao tamanho do bloco.
+    """
+    if mode == "table":
+        if size:
+            return _read_table_chunks(filename, size, usecols, dtype)
+        return _read_table(filename, usecols, dtype)
+    if mode is not None:
+        return _stream(filename, mode, size)
+    if filename.endswith(JSONL_EXTENSIONS):
+        # JSON Lines é sempre lido em streaming, um registro por vez
+        return _stream(filename, "records", size)
     # Se o arquivo já está aberto, use a referência
     if filename in open_files:
         try:
@@ -235,9 +316,130 @@ def Syread(filename):
     except Exception as e:
         return f"[ERRO AO LER] {str(e)}"
 
+@atexit.register
+def _flush_open_files():
+    """Ao fim do programa, descarrega o que ficou nos buffers de escrita."""
+    for file in list(open_files.values()):
+        try:
+            file.flush()
+        except Exception:
+            pass
+
+# ===== Leitura em streaming =====
+
+@contextmanager
+def _stream_file(filename):
+    """Arquivo para leitura em streaming: usa o de open_files (sem fechá-lo) ou abre um."""
+    if filename in open_files:
+        file = open_files[filename]
+        file.seek(0)
+        yield file
+    else:
+        with open(filename, 'r', encoding='utf-8', newline='') as file:
+            yield file
+
+def _stream_lines(filename, size):
+    """Uma linha por vez, sem a quebra de linha."""
+    with _stream_file(filename) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+def _stream_chunks(filename, size):
+    """Blocos de até `size` caracteres."""
+    size = size or DEFAULT_CHUNK_SIZE
+    with _stream_file(filename) as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                break
+            yield chunk
+
+def _stream_rows(filename, size):
+    """Linhas de um CSV/TSV como dicionários {coluna: valor}, pelo cabeçalho."""
+    delimiter = '\t' if filename.endswith('.tsv') else ','
+    with _stream_file(filename) as f:
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+def _stream_records(filename, size):
+    """Registros JSON Lines: cada linha não vazia vira um valor Syra (dict, lista...)."""
+    with _stream_file(filename) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Linha {lineno} de '{filename}' não é JSON válido: {e}") from None
+
+STREAM_MODES = {
+    "lines": _stream_lines,
+    "chunks": _stream_chunks,
+    "rows": _stream_rows,
+    "records": _stream_records,
+}
+
+def _stream(filename, mode, size=None):
+    """Leitor preguiçoso do modo pedido. Erros são levantados (não retornados como texto),
+    para que o each não percorra a mensagem e o &attempt possa capturá-los."""
+    reader = STREAM_MODES.get(mode)
+    if reader is None:
+        raise ValueError(f"Modo de leitura desconhecido: '{mode}'. Use: {', '.join(STREAM_MODES)}")
+    if filename not in open_files and not os.path.exists(filename):
+        raise FileNotFoundError(f"Arquivo '{filename}' não encontrado")
+    return reader(filename, size)
+
+def _read_table(filename, usecols=None, dtype=None):
+    """Lê CSV/TSV/Excel como tabela Syra, sem convertê-la em texto."""
+    import pandas as pd  # Carregado só na primeira leitura de tabela
+    import tbl
+    try:
+        if filename.endswith(('.csv', '.tsv')):
+            delimiter = '\t' if filename.endswith('.tsv') else ','
+            df = pd.read_csv(filename, delimiter=delimiter, usecols=usecols, dtype=tbl.pandas_dtypes(dtype))
+        elif filename.endswith(('.xlsx', '.xls')):
+            df = pd.read_excel(filename, usecols=usecols, dtype=tbl.pandas_dtypes(dtype))
+        else:
+            return f"[ERRO] Tabelas só podem ser lidas de CSV, TSV ou Excel: '{filename}'"
+        return tbl.SyraTable(df)
+    except Exception as e:
+        return f"[ERRO AO LER TABELA] {str(e)}"
+
+def _read_table_chunks(filename, size, usecols=None, dtype=None):
+    """
+    Lê um CSV/TSV em blocos de `size` linhas, cada um como tabela Syra.
+    Como o resultado vai para o each, erros são levantados (não retornados como
+    texto); usecols ou dtype inválidos viram ValueError, capturável com &attempt.
+    """
+    if not filename.endswith(('.csv', '.tsv')):
+        raise ValueError(f"Leitura em blocos só é suportada para CSV/TSV: '{filename}'")
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"Arquivo '{filename}' não encontrado")
+    import pandas as pd  # Carregado só na primeira leitura de tabela
+    import tbl
+    delimiter = '\t' if filename.endswith('.tsv') else ','
+    try:
+        reader = pd.read_csv(filename, delimiter=delimiter, usecols=usecols,
+                             dtype=tbl.pandas_dtypes(dtype), chunksize=int(size))
+    except Exception as e:
+        raise ValueError(f"Erro ao ler tabela '{filename}': {e}") from None
+    def chunks():
+        with reader:
+            while True:
+                # O dtype só é aplicado ao ler cada bloco, então o erro pode vir aqui
+                try:
+                    df = next(reader)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    raise ValueError(f"Erro ao ler tabela '{filename}': {e}") from None
+                yield tbl.SyraTable(df)
+    return chunks()
+
 def _read_tabular(filename):
     """Lê arquivos tabulares (CSV, TSV)."""
     try:
+        import pandas as pd  # Carregado só na primeira leitura de CSV/TSV
         delimiter = '\t' if filename.endswith('.tsv') else ','
         df = pd.read_csv(filename, delimiter=delimiter)
         return df.to_string()
@@ -245,17 +447,17 @@ def _read_tabular(filename):
         return f"[ERRO AO LER CSV/TSV] {str(e)}"
 
 def _read_json(filename):
-    """Lê arquivos JSON."""
+    """Lê arquivos JSON e retorna a estrutura (dicts, listas...), sem reconvertê-la em texto."""
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return json.dumps(data, indent=2)
+            return json.load(f)
     except Exception as e:
         return f"[ERRO AO LER JSON] {str(e)}"
 
 def _read_excel(filename):
     """Lê arquivos Excel."""
     try:
+        import pandas as pd  # Carregado só na primeira leitura de Excel
         df = pd.read_excel(filename)
         return df.to_string()
     except Exception as e:
@@ -475,7 +677,8 @@ Syra utiliza um sistema de escopos claro e consistente:
 
 ## Closures
 - Funções lambda capturam variáveis do escopo onde foram definidas
-- O escopo capturado é preservado no `closure_env` da função
+- O escopo capturado é preservado no `closure_env` da função, um frame encadeado
+  aos escopos de fora por referência (criar uma closure não copia variáveis)
 
 ## Boas Práticas
 - Use `$` para variáveis compartilhadas entre múltiplas funções
@@ -526,12 +729,13 @@ def cmd_syraos(args):
     return SyraOS(command, show_output)
 
 def cmd_syope(args):
-    """Comando para abrir ou criar arquivos."""
+    """
+    Comando para abrir ou criar arquivos.
+    Uso: &Syope(nome), &Syope(nome, extensão) ou &Syope(nome, extensão, buffer)
+    """
     from func import safe_eval
-    args_parts = args.split(",", 1)
-    filename = safe_eval(args_parts[0].strip())
-    extension = safe_eval(args_parts[1].strip()) if len(args_parts) > 1 else None
-    return Syope(filename, extension)
+    params = safe_eval(f"({args},)")
+    return Syope(*params)
 
 def cmd_sywr(args):
     """Comando para escrever em arquivos."""
@@ -549,48 +753,51 @@ def cmd_sycls(args):
     filename = safe_eval(args)
     return Sycls(filename)
 
-def cmd_syread(args):
-    """Comando para ler arquivos."""
+@functools.lru_cache(maxsize=256)
+def _split_call_args(args):
+    """
+    Divide os argumentos de um comando &Cmd(...) em expressões posicionais e
+    nomeadas (nome=valor), uma vez por texto de argumentos. $vars e &Cmd(...)
+    aninhados viram nomes Python só para a análise e voltam ao texto Syra.
+    """
+    source = re.sub(r"&(\w+)\s*\(", r"__syracmd_\1(", re.sub(r"\$(\w+)", r"__syra_\1", args))
+    try:
+        call = ast.parse("f(" + source + ")", mode="eval").body
+    except SyntaxError as e:
+        raise SyntaxError(f"argumentos inválidos '{args}': {e.msg}") from None
+    source = "f(" + source + ")"
+    def restore(node):
+        text = re.sub(r"__syracmd_(\w+)\(", r"&\1(", ast.get_source_segment(source, node))
+        return re.sub(r"__syra_(\w+)", r"$\1", text)
+    return (tuple(restore(arg) for arg in call.args),
+            tuple((kw.arg, restore(kw.value)) for kw in call.keywords))
+
+def _call_args(args):
+    """Avalia os argumentos de um comando &Cmd(...); retorna (posicionais, nomeados)."""
     from func import safe_eval
-    filename = safe_eval(args)
-    return Syread(filename)
+    positional, named = _split_call_args(args.strip())
+    return [safe_eval(expr) for expr in positional], {name: safe_eval(expr) for name, expr in named}
+
+def cmd_syread(args):
+    """
+    Comando para ler arquivos.
+    Uso: &Syread(arquivo), &Syread(arquivo, "lines" | "chunks" | "rows" | "records", tamanho)
+    ou &Syread(arquivo, "table", tamanho_do_bloco, usecols=[...], dtype={coluna: tipo})
+    """
+    try:
+        params, options = _call_args(args)
+    except SyntaxError as e:
+        return f"[ERRO] Syread: {e}"
+    return Syread(*params, **options)
 
 def cmd_attempt_block(lines):
     """
     Executa um bloco attempt/rescue.
     """
     import func
-    attempt_body = []
-    rescue_body = []
-    rescue_var = "e"
-    in_attempt = False
-    in_rescue = False
-
-    for line in lines:
-        line_stripped = line.strip()
-        if line_stripped.lower().startswith("&attempt:"):
-            in_attempt = True
-            in_rescue = False
-            continue
-        if line_stripped.lower().startswith("&rescue"):
-            in_attempt = False
-            in_rescue = True
-            m = re.match(r"&rescue\s+(\w+):", line_stripped, re.IGNORECASE)
-            if m:
-                rescue_var = m.group(1)
-            continue
-        if in_attempt and line_stripped:
-            attempt_body.append(line_stripped)
-        elif in_rescue and line_stripped:
-            rescue_body.append(line_stripped)
-
-    try:
-        for l in attempt_body:
-            func.execute_line(l)
-    except Exception as exc:
-        func.variables["$" + rescue_var] = str(exc)
-        for l in rescue_body:
-            func.execute_line(l)
+    import prs
+    for node in prs.parse("\n".join(lines)):
+        func.execute_node(node)
 
 def cmd_run_orv(args):
     """